@@ -38,6 +38,10 @@ from typing import Any
 
 from pydantic import BaseModel
 
+# Clock for cooldown bookkeeping; a module attribute so tests can substitute
+# a fake clock instead of sleeping through real cooldowns.
+_now = time.monotonic
+
 
 class CircuitBreakerState(Enum):
     """Circuit breaker states."""
@@ -178,12 +182,12 @@ class CircuitBreaker:
                 self._consecutive_failures = 0
                 self._half_open_calls = 0
                 self._transition_to(CircuitBreakerState.OPEN)
-                self._opened_at = time.monotonic()
+                self._opened_at = _now()
             elif self._state == CircuitBreakerState.CLOSED:
                 self._consecutive_failures += 1
                 if self._consecutive_failures >= self._config.max_failures:
                     self._transition_to(CircuitBreakerState.OPEN)
-                    self._opened_at = time.monotonic()
+                    self._opened_at = _now()
 
     def reset(self) -> None:
         """Force circuit breaker back to CLOSED state, clearing all counters."""
@@ -199,7 +203,7 @@ class CircuitBreaker:
         Must be called with self._lock held.
         """
         if self._state == CircuitBreakerState.OPEN and self._opened_at is not None:
-            elapsed = time.monotonic() - self._opened_at
+            elapsed = _now() - self._opened_at
             if elapsed >= self._config.cooldown_seconds:
                 self._transition_to(CircuitBreakerState.HALF_OPEN)
                 self._half_open_calls = 0
@@ -10,12 +10,16 @@ import json
 import os
 import sys
 import time
+from collections import Counter
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from claude_code_kazuba.hook_base import fail_open
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # --- Configuration ---
 DEFAULT_LOG_DIR: str = os.path.expanduser("~/.claude/compliance")
 MAX_LOG_SIZE_BYTES: int = 5 * 1024 * 1024  # 5 MB
@@ -61,6 +65,26 @@ class ComplianceStats:
         elif event.decision == "error":
             self.error_count += 1
 
+    def record_batch(self, events: Sequence[ComplianceEvent]) -> None:
+        """Record many events at once; equivalent to calling record() for each.
+
+        Tool and decision tallies are accumulated with ``Counter`` (a C loop)
+        and merged into the stats once, instead of per-event dict updates.
+
+        Args:
+            events: The compliance events to record.
+        """
+        if not events:
+            return
+        self.total_events += len(events)
+        for tool_name, count in Counter(e.tool_name for e in events).items():
+            self.tool_counts[tool_name] = self.tool_counts.get(tool_name, 0) + count
+
+        decisions = Counter(e.decision for e in events)
+        self.block_count += decisions["block"]
+        self.allow_count += decisions["allow"]
+        self.error_count += decisions["error"]
+
     @property
     def compliance_score(self) -> float:
         """Calculate compliance score (0-1).
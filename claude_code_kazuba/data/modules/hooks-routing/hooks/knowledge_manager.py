@@ -68,22 +68,42 @@ def tier2_project_docs(cwd: str) -> list[KnowledgeEntry]:
         List of KnowledgeEntry from project docs.
     """
     entries: list[KnowledgeEntry] = []
-    cwd_path = Path(cwd)
 
+    # One scandir of cwd stands in for a stat per candidate: top-level docs are
+    # matched by name, and nested ones are only probed when their directory
+    # exists. ``""`` still means the process cwd, as with ``Path("")``.
+    files: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(cwd or ".") as it:
+            for entry in it:
+                if entry.is_file():
+                    files.add(entry.name)
+                elif entry.is_dir():
+                    dirs.add(entry.name)
+    except OSError:
+        return entries
+
+    cwd_path = Path(cwd)
     for doc_name in PROJECT_DOC_FILES:
         doc_path = cwd_path / doc_name
-        if doc_path.is_file():
-            try:
-                content = doc_path.read_text(encoding="utf-8")[:MAX_DOC_BYTES]
-                entries.append(
-                    KnowledgeEntry(
-                        tier=2,
-                        source=doc_name,
-                        content=content,
-                    )
-                )
-            except (OSError, UnicodeDecodeError):
+        parent, sep, _ = doc_name.partition("/")
+        if sep:
+            if parent not in dirs or not doc_path.is_file():
                 continue
+        elif doc_name not in files:
+            continue
+        try:
+            content = doc_path.read_text(encoding="utf-8")[:MAX_DOC_BYTES]
+            entries.append(
+                KnowledgeEntry(
+                    tier=2,
+                    source=doc_name,
+                    content=content,
+                )
+            )
+        except (OSError, UnicodeDecodeError):
+            continue
     return entries
 
 
@@ -4,7 +4,9 @@ Provides synchronous and asynchronous event dispatching with priority
 ordering and error isolation. Handlers that raise exceptions are logged
 and skipped — remaining handlers still execute.
 
-Thread-safe via threading.Lock for subscription management.
+Thread-safe via threading.Lock for subscription management. Each event
+type's subscribers are an immutable tuple that is replaced (never mutated)
+on subscribe/unsubscribe, so publishing reads it without taking the lock.
 
 Usage:
     bus = EventBus()
@@ -19,12 +21,14 @@ Priority ordering: lower number = higher priority (0 = first).
 
 from __future__ import annotations
 
+import bisect
 import logging
 import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -32,11 +36,16 @@ logger = logging.getLogger(__name__)
 # Type alias for event handler functions
 EventHandler = Callable[["Event"], None]
 
+_by_priority = attrgetter("priority")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Event:
     """An immutable event dispatched through the event bus.
 
+    Slotted, so each publish allocates one small fixed-size object and no
+    per-instance ``__dict__``. Handlers may keep the events they receive.
+
     Args:
         event_type: String identifier for the event category.
         data: Arbitrary payload data.
@@ -50,7 +59,7 @@ class Event:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class _Subscription:
     """Internal subscription record with priority ordering."""
 
@@ -66,13 +75,17 @@ class EventBus:
     handler is called — no exception propagates to the publisher.
 
     For non-blocking dispatch, use publish_async() which runs handlers
-    in a thread pool.
+    in a thread pool. The pool is created on first use and its worker
+    threads are reused across publishes; shutdown() drains and releases it.
     """
 
     def __init__(self) -> None:
-        self._subscriptions: dict[str, list[_Subscription]] = {}
+        self._subscriptions: dict[str, tuple[_Subscription, ...]] = {}
+        # Snapshot of the subscribed event types, replaced only when a type
+        # gains its first or loses its last subscriber.
+        self._event_types: frozenset[str] = frozenset()
         self._lock = threading.Lock()
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._executor: ThreadPoolExecutor | None = None
 
     def subscribe(
         self,
@@ -82,6 +95,9 @@ class EventBus:
     ) -> None:
         """Register a handler for an event type.
 
+        The subscriber list is kept in priority order by inserting at the
+        right position, after any existing handlers of equal priority.
+
         Args:
             event_type: Event type string to listen for.
             handler: Callable that receives an Event object.
@@ -89,10 +105,11 @@ class EventBus:
         """
         sub = _Subscription(handler=handler, priority=priority)
         with self._lock:
-            if event_type not in self._subscriptions:
-                self._subscriptions[event_type] = []
-            self._subscriptions[event_type].append(sub)
-            self._subscriptions[event_type].sort(key=lambda s: s.priority)
+            subs = list(self._subscriptions.get(event_type, ()))
+            bisect.insort_right(subs, sub, key=_by_priority)
+            self._subscriptions[event_type] = tuple(subs)
+            if len(subs) == 1:
+                self._event_types = self._event_types | {event_type}
 
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
         """Remove a handler from an event type.
@@ -106,11 +123,12 @@ class EventBus:
         with self._lock:
             if event_type not in self._subscriptions:
                 return
-            self._subscriptions[event_type] = [
-                s for s in self._subscriptions[event_type] if s.handler is not handler
-            ]
-            if not self._subscriptions[event_type]:
+            subs = tuple(s for s in self._subscriptions[event_type] if s.handler is not handler)
+            if subs:
+                self._subscriptions[event_type] = subs
+            else:
                 del self._subscriptions[event_type]
+                self._event_types = self._event_types - {event_type}
 
     def publish(
         self,
@@ -121,22 +139,25 @@ class EventBus:
         """Dispatch event to all subscribers synchronously, ordered by priority.
 
         If a handler raises, the error is logged and remaining handlers
-        continue to execute.
+        continue to execute. With no subscribers this returns before any
+        Event is created.
 
         Args:
             event_type: Event type string.
             data: Payload data dict.
             source: Identifier of the event producer.
         """
-        event = Event(
-            event_type=event_type,
-            data=data,
-            timestamp=time.time(),
-            source=source,
+        # A single dict read of an immutable tuple: no lock, no copy
+        subs = self._subscriptions.get(event_type)
+        if not subs:
+            return
+        self._dispatch(
+            Event(event_type=event_type, data=data, timestamp=time.time(), source=source),
+            subs,
         )
-        with self._lock:
-            subs = list(self._subscriptions.get(event_type, []))
 
+    def _dispatch(self, event: Event, subs: tuple[_Subscription, ...]) -> None:
+        """Call each subscriber in ``subs`` (already in priority order) with event."""
         for sub in subs:
             try:
                 sub.handler(event)
@@ -144,7 +165,7 @@ class EventBus:
                 logger.exception(
                     "Handler %r raised for event '%s'",
                     sub.handler,
-                    event_type,
+                    event.event_type,
                 )
 
     def publish_async(
@@ -155,17 +176,46 @@ class EventBus:
     ) -> None:
         """Dispatch event to subscribers in a thread pool (non-blocking).
 
+        The event (and its timestamp) and the subscriber snapshot are taken
+        here, at publish time; only the handler calls run on the pool. With
+        no subscribers nothing is created or submitted.
+
         Args:
             event_type: Event type string.
             data: Payload data dict.
             source: Identifier of the event producer.
         """
-        self._executor.submit(self.publish, event_type, data, source)
+        subs = self._subscriptions.get(event_type)
+        if not subs:
+            return
+        event = Event(event_type=event_type, data=data, timestamp=time.time(), source=source)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="eventbus")
+            # Submit under the lock so a concurrent shutdown() cannot retire
+            # this executor between the lookup and the submit.
+            self._executor.submit(self._dispatch, event, subs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the async dispatch pool.
+
+        Events already passed to publish_async() are still delivered; with
+        ``wait`` (the default) this blocks until they have been. A later
+        publish_async() starts a fresh pool.
+
+        Args:
+            wait: Block until pending async dispatches have finished.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
 
     def clear(self) -> None:
         """Remove all subscriptions."""
         with self._lock:
             self._subscriptions.clear()
+            self._event_types = frozenset()
 
     def subscribers(self, event_type: str) -> list[EventHandler]:
         """Return list of handlers for an event type.
@@ -176,12 +226,13 @@ class EventBus:
         Returns:
             List of registered handler callables.
         """
-        with self._lock:
-            subs = self._subscriptions.get(event_type, [])
-            return [s.handler for s in subs]
+        return [s.handler for s in self._subscriptions.get(event_type, ())]
 
     @property
-    def event_types(self) -> set[str]:
-        """Return set of all event types that have subscribers."""
-        with self._lock:
-            return set(self._subscriptions.keys())
+    def event_types(self) -> frozenset[str]:
+        """Return the set of all event types that have subscribers.
+
+        The set is an immutable snapshot kept up to date by subscribe(),
+        unsubscribe() and clear(), so reading it neither locks nor copies.
+        """
+        return self._event_types
@@ -17,6 +17,9 @@ Max entries limit prevents unbounded memory growth.
 from __future__ import annotations
 
 import json
+import os
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -25,6 +28,31 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from pathlib import Path
 
+# Shared compact encoder: json.dumps() with non-default separators builds a
+# fresh JSONEncoder on every call.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Wall clock in nanoseconds; module-level so tests can substitute it.
+_now_ns = time.time_ns
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds.
+
+    The date-and-seconds part is formatted once per wall-clock second and
+    reused; each call only formats the microseconds tail.
+    """
+    global _ts_cache
+    sec, rem_ns = divmod(_now_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if cached_sec != sec:
+        prefix = datetime.fromtimestamp(sec, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{rem_ns // 1000:06d}+00:00"
+
 
 class LogLevel(Enum):
     """Log severity levels."""
@@ -76,7 +104,7 @@ class HookLogger:
         self._hook_name = hook_name
         self._log_dir = log_dir
         self._max_entries = max_entries
-        self._entries: list[LogEntry] = []
+        self._entries: deque[LogEntry] = deque(maxlen=max_entries)
 
     @property
     def hook_name(self) -> str:
@@ -91,7 +119,7 @@ class HookLogger:
     def _add_entry(self, level: LogLevel, message: str, metadata: dict[str, Any]) -> None:
         """Create and buffer a log entry.
 
-        If max_entries is exceeded, the oldest entry is dropped.
+        If max_entries is exceeded, the buffer drops the oldest entry.
 
         Args:
             level: Log severity.
@@ -99,15 +127,13 @@ class HookLogger:
             metadata: Additional structured data.
         """
         entry = LogEntry(
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=_now_iso(),
             level=level,
             hook_name=self._hook_name,
             message=message,
             metadata=metadata,
         )
         self._entries.append(entry)
-        if len(self._entries) > self._max_entries:
-            self._entries = self._entries[-self._max_entries :]
 
     def debug(self, message: str, **metadata: Any) -> None:
         """Log a debug-level message.
@@ -163,16 +189,31 @@ class HookLogger:
         Returns:
             String with one JSON object per line.
         """
-        lines = [json.dumps(self._entry_to_dict(e)) for e in self._entries]
-        return "\n".join(lines)
+        encode = _ENCODER.encode
+        to_dict = self._entry_to_dict
+        return "\n".join([encode(to_dict(e)) for e in self._entries])
 
-    def flush(self, path: Path) -> None:
+    def flush(self, path: Path, append: bool = False) -> None:
         """Write all buffered entries to a JSONL file.
 
+        The payload is encoded once and written straight to a raw file
+        descriptor, bypassing the text and buffering layers of ``open()``.
+        Every line, including the last, ends with a newline, so appended
+        flushes concatenate into valid JSONL.
+
         Args:
             path: File path to write to. Parent directories must exist.
+            append: Add to the end of an existing file instead of replacing it.
         """
-        path.write_text(self.to_jsonl(), encoding="utf-8")
+        payload = (self.to_jsonl() + "\n").encode("utf-8") if self._entries else b""
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
     def clear(self) -> None:
         """Remove all buffered entries."""
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # Map of manifest files to language/framework detection
 _MANIFEST_MAP: list[tuple[str, str, str | None]] = [
@@ -21,117 +26,163 @@ _MANIFEST_MAP: list[tuple[str, str, str | None]] = [
 ]
 
 
-def _detect_python_version(target_dir: Path) -> str | None:
-    """Try to extract Python version from pyproject.toml."""
-    pyproject = target_dir / "pyproject.toml"
-    if not pyproject.exists():
-        return None
+def _list_entries(target_dir: Path) -> dict[str, os.DirEntry[str]]:
+    """List the files in a directory once; manifest checks become dict lookups.
+
+    ``DirEntry.is_file()`` answers from the type readdir already returned,
+    so filtering out directories costs no extra ``stat`` (symlinks aside).
+    """
     try:
-        text = pyproject.read_text(encoding="utf-8")
-        # Match requires-python = ">=3.12"
-        match = re.search(r'requires-python\s*=\s*"([^"]+)"', text)
-        if match:
-            return match.group(1)
+        with os.scandir(target_dir) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
     except OSError:
-        pass
-    return None
+        return {}
+
 
+# Manifests are scanned from this prefix first; the rest is only read when
+# the prefix cannot settle the answer.
+_MANIFEST_HEAD_SIZE = 16384
 
-def _detect_python_framework(target_dir: Path) -> str | None:
-    """Detect Python framework from pyproject.toml dependencies."""
-    pyproject = target_dir / "pyproject.toml"
-    if not pyproject.exists():
+# Python frameworks in priority order (first hit wins)
+_PY_FRAMEWORKS = (b"django", b"flask", b"fastapi")
+_PY_FRAMEWORK_RE = re.compile(b"|".join(map(re.escape, _PY_FRAMEWORKS)), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_manifest(path: str, mtime_ns: int, size: int, limit: int = -1) -> bytes | None:
+    """Read up to ``limit`` bytes of a manifest (-1: all), memoized per (path, mtime, size)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(limit)
+    except OSError:
+        return None
+
+
+def _manifest_stat(entries: dict[str, os.DirEntry[str]], name: str) -> os.stat_result | None:
+    entry = entries.get(name)
+    if entry is None:
         return None
     try:
-        text = pyproject.read_text(encoding="utf-8").lower()
-        if "django" in text:
-            return "django"
-        if "flask" in text:
-            return "flask"
-        if "fastapi" in text:
-            return "fastapi"
+        return entry.stat()
     except OSError:
-        pass
-    return None
+        return None
 
 
-def _detect_js_typescript(target_dir: Path) -> bool:
-    """Check if a JS project uses TypeScript."""
-    return (target_dir / "tsconfig.json").exists()
+def _manifest_bytes(entries: dict[str, os.DirEntry[str]], name: str) -> bytes | None:
+    """Return the full content of manifest ``name`` if it was listed, else None."""
+    st = _manifest_stat(entries, name)
+    if st is None:
+        return None
+    return _read_manifest(entries[name].path, st.st_mtime_ns, st.st_size)
+
 
+def _scan_manifest(
+    entries: dict[str, os.DirEntry[str]],
+    name: str,
+    detect: Callable[[bytes], str | None],
+    settled: Callable[[str | None], bool] = lambda found: found is not None,
+) -> str | None:
+    """Run ``detect`` on the head of manifest ``name``, falling back to the whole file.
 
-def _detect_js_framework(target_dir: Path) -> str | None:
-    """Detect JS/TS framework from package.json."""
-    pkg = target_dir / "package.json"
-    if not pkg.exists():
+    The fallback read only happens when the file is longer than the head and
+    the head's answer is not ``settled``.
+    """
+    st = _manifest_stat(entries, name)
+    if st is None:
         return None
-    try:
-        data: dict[str, Any] = json.loads(pkg.read_text(encoding="utf-8"))
-        deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-        if "next" in deps:
-            return "next"
-        if "react" in deps:
-            return "react"
-        if "vue" in deps:
-            return "vue"
-        if "svelte" in deps:
-            return "svelte"
-        if "@angular/core" in deps:
-            return "angular"
-        if "express" in deps:
-            return "express"
-    except (OSError, json.JSONDecodeError):
-        pass
-    return None
+    path = entries[name].path
+    head = _read_manifest(path, st.st_mtime_ns, st.st_size, _MANIFEST_HEAD_SIZE)
+    if head is None:
+        return None
+    found = detect(head)
+    if not settled(found) and st.st_size > len(head):
+        full = _read_manifest(path, st.st_mtime_ns, st.st_size)
+        if full is not None:
+            found = detect(full)
+    return found
 
 
-def _detect_node_version(target_dir: Path) -> str | None:
-    """Try to extract Node version from package.json engines field."""
-    pkg = target_dir / "package.json"
-    if not pkg.exists():
+def _load_package_json(data: bytes | None) -> dict[str, Any] | None:
+    """Parse package.json content, or None if missing or malformed."""
+    if data is None:
         return None
     try:
-        data: dict[str, Any] = json.loads(pkg.read_text(encoding="utf-8"))
-        engines = data.get("engines", {})
-        return engines.get("node")
-    except (OSError, json.JSONDecodeError):
-        pass
+        pkg = json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return cast("dict[str, Any]", pkg) if isinstance(pkg, dict) else None
+
+
+def _detect_python_version(pyproject: bytes) -> str | None:
+    """Try to extract Python version from pyproject.toml content."""
+    # Match requires-python = ">=3.12"
+    match = re.search(rb'requires-python\s*=\s*"([^"]+)"', pyproject)
+    if match:
+        return match.group(1).decode("utf-8", "replace")
     return None
 
 
-def _detect_go_version(target_dir: Path) -> str | None:
-    """Try to extract Go version from go.mod."""
-    gomod = target_dir / "go.mod"
-    if not gomod.exists():
-        return None
-    try:
-        text = gomod.read_text(encoding="utf-8")
-        match = re.search(r"^go\s+(\d+\.\d+(?:\.\d+)?)", text, re.MULTILINE)
-        if match:
-            return match.group(1)
-    except OSError:
-        pass
+def _detect_python_framework(pyproject: bytes) -> str | None:
+    """Detect Python framework from pyproject.toml dependencies.
+
+    One case-insensitive pass collects every framework keyword present;
+    the winner is then chosen by ``_PY_FRAMEWORKS`` priority, not position.
+    """
+    found = {m.group().lower() for m in _PY_FRAMEWORK_RE.finditer(pyproject)}
+    for framework in _PY_FRAMEWORKS:
+        if framework in found:
+            return framework.decode()
     return None
 
 
-def _detect_rust_version(target_dir: Path) -> str | None:
-    """Try to extract Rust edition from Cargo.toml."""
-    cargo = target_dir / "Cargo.toml"
-    if not cargo.exists():
-        return None
-    try:
-        text = cargo.read_text(encoding="utf-8")
-        match = re.search(r'edition\s*=\s*"(\d{4})"', text)
-        if match:
-            return f"edition-{match.group(1)}"
-    except OSError:
-        pass
+def _detect_js_framework(pkg: dict[str, Any]) -> str | None:
+    """Detect JS/TS framework from parsed package.json."""
+    deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
+    if "next" in deps:
+        return "next"
+    if "react" in deps:
+        return "react"
+    if "vue" in deps:
+        return "vue"
+    if "svelte" in deps:
+        return "svelte"
+    if "@angular/core" in deps:
+        return "angular"
+    if "express" in deps:
+        return "express"
+    return None
+
+
+def _detect_node_version(pkg: dict[str, Any]) -> str | None:
+    """Try to extract Node version from the package.json engines field."""
+    engines = pkg.get("engines", {})
+    return engines.get("node")
+
+
+def _detect_go_version(gomod: bytes) -> str | None:
+    """Try to extract Go version from go.mod content."""
+    match = re.search(rb"^go\s+(\d+\.\d+(?:\.\d+)?)", gomod, re.MULTILINE)
+    if match:
+        return match.group(1).decode()
+    return None
+
+
+def _detect_rust_version(cargo: bytes) -> str | None:
+    """Try to extract Rust edition from Cargo.toml content."""
+    match = re.search(rb'edition\s*=\s*"(\d{4})"', cargo)
+    if match:
+        return f"edition-{match.group(1).decode()}"
     return None
 
 
 def detect_stack(target_dir: Path) -> dict[str, str]:
     """Detect project type by checking for manifest files.
 
+    The directory is listed once with ``os.scandir``; every manifest check is
+    a lookup in that listing. Text manifests are scanned as bytes from a
+    bounded head, read in full only when the head is inconclusive, and reads
+    are reused across calls while the file's mtime is unchanged.
+
     Args:
         target_dir: Path to the project root directory.
 
@@ -139,11 +190,11 @@ def detect_stack(target_dir: Path) -> dict[str, str]:
         Dict with keys: language, and optionally version, framework.
         Returns {"language": "unknown"} if no manifest is found.
     """
-    target = Path(target_dir)
+    entries = _list_entries(Path(target_dir))
     result: dict[str, str] = {"language": "unknown"}
 
     for manifest_file, language, framework in _MANIFEST_MAP:
-        if (target / manifest_file).exists():
+        if manifest_file in entries:
             result["language"] = language
             if framework:
                 result["framework"] = framework
@@ -152,30 +203,38 @@ def detect_stack(target_dir: Path) -> dict[str, str]:
     lang = result["language"]
 
     if lang == "python":
-        version = _detect_python_version(target)
+        version = _scan_manifest(entries, "pyproject.toml", _detect_python_version)
         if version:
             result["version"] = version
-        fw = _detect_python_framework(target)
+        # Only the top-priority framework can be trusted from the head alone
+        fw = _scan_manifest(
+            entries,
+            "pyproject.toml",
+            _detect_python_framework,
+            settled=lambda found: found == _PY_FRAMEWORKS[0].decode(),
+        )
         if fw:
             result["framework"] = fw
 
     elif lang == "javascript":
-        if _detect_js_typescript(target):
+        if "tsconfig.json" in entries:
             result["language"] = "typescript"
-        version = _detect_node_version(target)
-        if version:
-            result["version"] = version
-        fw = _detect_js_framework(target)
-        if fw:
-            result["framework"] = fw
+        pkg = _load_package_json(_manifest_bytes(entries, "package.json"))
+        if pkg is not None:
+            version = _detect_node_version(pkg)
+            if version:
+                result["version"] = version
+            fw = _detect_js_framework(pkg)
+            if fw:
+                result["framework"] = fw
 
     elif lang == "go":
-        version = _detect_go_version(target)
+        version = _scan_manifest(entries, "go.mod", _detect_go_version)
         if version:
             result["version"] = version
 
     elif lang == "rust":
-        version = _detect_rust_version(target)
+        version = _scan_manifest(entries, "Cargo.toml", _detect_rust_version)
         if version:
             result["version"] = version
 
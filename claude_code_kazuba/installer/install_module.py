@@ -2,30 +2,49 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Any
 
 from claude_code_kazuba.installer.merge_settings import merge_settings
+from claude_code_kazuba.performance import ParallelExecutor
 
 # Directories within a module that get copied to .claude/
 _CONTENT_DIRS = ("hooks", "skills", "agents", "commands", "contexts", "config", "templates", "src")
 
+# Upper bound on concurrent subtree copies within one module
+_MAX_COPY_WORKERS = 8
+
+# Bytecode never belongs in an installed tree
+_IGNORE_BYTECODE = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo")
+
+# Serializes read-merge-write of settings.json across threads in this process
+_SETTINGS_LOCK = threading.Lock()
+
 # Template file extensions
 _TEMPLATE_EXT = ".template"
 
 
-def _copy_directory(src: Path, dest: Path, copied: list[str]) -> None:
-    """Recursively copy a directory, tracking copied files."""
-    dest.mkdir(parents=True, exist_ok=True)
-    for item in sorted(src.rglob("*")):
-        if item.is_file() and "__pycache__" not in str(item) and item.suffix != ".pyc":
-            rel = item.relative_to(src)
-            target = dest / rel
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target)
-            copied.append(str(target))
+def _copy_directory(src: Path, dest: Path) -> list[str]:
+    """Recursively copy a directory, returning the copied file paths (sorted).
+
+    ``shutil.copytree`` walks the tree with bytecode excluded up front by
+    ``_IGNORE_BYTECODE``; files are copied with ``shutil.copy`` (content and
+    permission bits; timestamps are not needed in the installed tree).
+    """
+    copied: list[str] = []
+
+    def _copy(src_file: str, dest_file: str) -> str:
+        copied.append(dest_file)
+        return shutil.copy(src_file, dest_file)
+
+    shutil.copytree(src, dest, ignore=_IGNORE_BYTECODE, copy_function=_copy, dirs_exist_ok=True)
+    copied.sort()
+    return copied
 
 
 def _render_template(template_path: Path, output_path: Path, variables: dict[str, Any]) -> None:
@@ -44,23 +63,38 @@ def _merge_hooks_settings(
     hooks_json_path: Path,
     merged: list[str],
 ) -> None:
-    """Merge a module's settings.hooks.json into target settings.json."""
+    """Merge a module's settings.hooks.json into target settings.json.
+
+    The merged file is written to a sibling temp file and moved into place
+    with ``os.replace``, so readers never see a partially written
+    settings.json; ``_SETTINGS_LOCK`` keeps concurrent merges in this
+    process from losing each other's updates.
+    """
     overlay: dict[str, Any] = json.loads(hooks_json_path.read_text(encoding="utf-8"))
 
-    base: dict[str, Any]
-    if settings_path.exists():
-        base = json.loads(settings_path.read_text(encoding="utf-8"))
-    else:
-        base = {
-            "$schema": "https://json.schemastore.org/claude-code-settings.json",
-            "permissions": {"allow": [], "deny": []},
-            "hooks": {},
-            "env": {},
-        }
-
-    result = merge_settings(base, overlay)
-    settings_path.parent.mkdir(parents=True, exist_ok=True)
-    settings_path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    with _SETTINGS_LOCK:
+        base: dict[str, Any]
+        if settings_path.exists():
+            base = json.loads(settings_path.read_text(encoding="utf-8"))
+        else:
+            base = {
+                "$schema": "https://json.schemastore.org/claude-code-settings.json",
+                "permissions": {"allow": [], "deny": []},
+                "hooks": {},
+                "env": {},
+            }
+
+        result = merge_settings(base, overlay)
+        settings_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = settings_path.with_name(
+            f"{settings_path.name}.tmp-{os.getpid()}-{threading.get_ident()}"
+        )
+        try:
+            tmp_path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp_path, settings_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     merged.append(str(hooks_json_path))
 
 
@@ -111,18 +145,21 @@ def install_module(
     claude_dir = target_dir / ".claude"
     claude_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy content directories
-    for content_dir_name in _CONTENT_DIRS:
-        content_src = module_path / content_dir_name
-        if content_src.is_dir():
-            content_dest = claude_dir / content_dir_name
-            _copy_directory(content_src, content_dest, result["copied"])
-
-    # Copy rules (core module special case)
-    rules_src = module_path / "rules"
-    if rules_src.is_dir():
-        rules_dest = claude_dir / "rules"
-        _copy_directory(rules_src, rules_dest, result["copied"])
+    # Copy content directories (plus rules, the core module special case).
+    # Each lands in its own .claude/ subtree and file copying releases the
+    # GIL, so the subtrees are copied concurrently.
+    copy_jobs = [
+        functools.partial(_copy_directory, module_path / name, claude_dir / name)
+        for name in (*_CONTENT_DIRS, "rules")
+        if (module_path / name).is_dir()
+    ]
+    if len(copy_jobs) > 1:
+        workers = min(_MAX_COPY_WORKERS, len(copy_jobs))
+        copied_per_dir = ParallelExecutor(max_workers=workers).run(copy_jobs)
+    else:
+        copied_per_dir = [job() for job in copy_jobs]
+    for copied in copied_per_dir:
+        result["copied"].extend(copied)
 
     # Process template files
     for template_file in sorted(module_path.glob(f"*{_TEMPLATE_EXT}")):
@@ -10,33 +10,78 @@ Merge rules:
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+# orjson (optional) parses straight from bytes in C; stdlib json is the fallback
+_orjson: Any = None
+
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:
+    _orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib parser.
+
+    orjson is stricter than the stdlib: it rejects ``NaN``/``Infinity``
+    literals and integers wider than 64 bits. Anything it rejects is
+    re-parsed with ``json.loads``, so installing orjson never makes a
+    settings file unmergeable; truly invalid JSON still raises
+    ``json.JSONDecodeError`` from the stdlib parser.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+_SCALARS = (str, int, float, bool)
+
+
+def _dedupe_key(item: Any) -> Hashable:
+    """Hashable identity for a list item.
+
+    Flat dicts (the usual hook entry: type, command, timeout, matcher) are
+    keyed by their items directly, with each value's type so ``True`` stays
+    distinct from ``1``; anything nested falls back to canonical JSON.
+    """
+    if isinstance(item, _SCALARS):
+        return item
+    if isinstance(item, dict):
+        entry = cast("dict[str, Any]", item)
+        if all(value is None or isinstance(value, _SCALARS) for value in entry.values()):
+            return frozenset((name, value.__class__, value) for name, value in entry.items())
+    return json.dumps(item, sort_keys=True)
 
 
 def _extend_unique(base: list[Any], overlay: list[Any]) -> list[Any]:
     """Extend a list with items from overlay, avoiding duplicates.
 
-    Preserves order: base items first, then new overlay items.
+    Preserves order: base items first, then new overlay items. Membership is
+    a hash lookup; hook entries (dicts) are compared by full content, since
+    two entries sharing a command may still differ in matcher or timeout.
     """
-    result = list(base)
-    seen: set[str | int | float | bool] = set()
-    for item in base:
-        if isinstance(item, (str, int, float, bool)):
-            seen.add(item)
-        else:
-            seen.add(json.dumps(item, sort_keys=True))
-
+    if all(isinstance(item, str) for item in overlay) and all(
+        isinstance(item, str) for item in base
+    ):
+        # Permission rules: plain strings, deduped in one ordered dict pass
+        seen = set(base)
+        return [*base, *dict.fromkeys(item for item in overlay if item not in seen)]
+
+    seen_keys = {_dedupe_key(item) for item in base}
+    additions: dict[Any, Any] = {}
     for item in overlay:
-        key = (
-            item if isinstance(item, (str, int, float, bool)) else json.dumps(item, sort_keys=True)
-        )
-        if key not in seen:
-            seen.add(key)
-            result.append(item)
-
-    return result
+        key = _dedupe_key(item)
+        if key not in seen_keys:
+            additions.setdefault(key, item)
+    return [*base, *additions.values()]
 
 
 def _merge_hooks(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
@@ -45,28 +90,27 @@ def _merge_hooks(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any
     For each event (PreToolUse, PostToolUse, etc.), append new hooks
     from overlay without removing existing ones from base.
     """
-    result = deepcopy(base)
+    result = dict(base)
 
     for event, hooks in overlay.items():
         if event not in result:
-            result[event] = deepcopy(hooks)
+            result[event] = hooks
         elif isinstance(result[event], list) and isinstance(hooks, list):
             result[event] = _extend_unique(
                 cast("list[Any]", result[event]), cast("list[Any]", hooks)
             )
-        else:
+        elif isinstance(result[event], dict) and isinstance(hooks, dict):
             # Non-list hook config: overlay wins for new keys
-            if isinstance(result[event], dict) and isinstance(hooks, dict):
-                result[event] = {**result[event], **deepcopy(cast("dict[str, Any]", hooks))}
-            else:
-                result[event] = deepcopy(hooks)
+            result[event] = {**result[event], **cast("dict[str, Any]", hooks)}
+        else:
+            result[event] = hooks
 
     return result
 
 
 def _merge_permissions(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
     """Merge permissions: extend allow and deny arrays."""
-    result = deepcopy(base)
+    result = dict(base)
 
     for key in ("allow", "deny"):
         if key in overlay:
@@ -76,17 +120,16 @@ def _merge_permissions(base: dict[str, Any], overlay: dict[str, Any]) -> dict[st
                     cast("list[Any]", base_list), cast("list[Any]", overlay[key])
                 )
             else:
-                result[key] = deepcopy(overlay[key])
+                result[key] = overlay[key]
 
     return result
 
 
 def _merge_env(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
     """Merge env vars: add new keys, preserve existing values."""
-    result = deepcopy(base)
+    result = dict(base)
     for key, value in overlay.items():
-        if key not in result:
-            result[key] = value
+        result.setdefault(key, value)
     return result
 
 
@@ -100,14 +143,18 @@ def merge_settings(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, A
     - env: merge dicts (new keys only, existing preserved)
     - Other keys: overlay wins if base doesn't have it
 
+    Only the containers on the merge path are rebuilt; subtrees the merge
+    does not touch are shared with the inputs rather than deep-copied.
+
     Args:
         base: The existing settings dict (user's config).
         overlay: The new settings to merge in (from module).
 
     Returns:
-        Merged settings dict. Original dicts are not modified.
+        Merged settings dict. Original dicts are not modified, but unchanged
+        nested values are shared with them; copy before mutating in place.
     """
-    result = deepcopy(base)
+    result = dict(base)
 
     # $schema
     if "$schema" not in result and "$schema" in overlay:
@@ -137,7 +184,7 @@ def merge_settings(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, A
     # Any other top-level keys from overlay not already in result
     for key in overlay:
         if key not in result:
-            result[key] = deepcopy(overlay[key])
+            result[key] = overlay[key]
 
     return result
 
@@ -154,13 +201,15 @@ def merge_settings_file(base_path: Path, overlay_path: Path) -> dict[str, Any]:
 
     Raises:
         FileNotFoundError: If overlay_path doesn't exist.
-        json.JSONDecodeError: If either file is not valid JSON.
+        json.JSONDecodeError: If either file is not valid JSON (orjson's error
+            type subclasses it).
     """
-    base: dict[str, Any] = (
-        json.loads(base_path.read_text(encoding="utf-8")) if base_path.exists() else {}
-    )
+    try:
+        base: dict[str, Any] = _loads(base_path.read_bytes())
+    except FileNotFoundError:
+        base = {}
 
-    overlay: dict[str, Any] = json.loads(overlay_path.read_text(encoding="utf-8"))
+    overlay: dict[str, Any] = _loads(overlay_path.read_bytes())
     return merge_settings(base, overlay)
 
 
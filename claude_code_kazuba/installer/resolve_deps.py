@@ -2,67 +2,86 @@
 
 from __future__ import annotations
 
-import re
+import heapq
+import math
+import os
+import sys
+from collections import deque
 from pathlib import Path
 from typing import Any
 
+from claude_code_kazuba.performance import L0Cache
 
-def _parse_yaml_frontmatter(text: str) -> dict[str, Any]:
-    """Extract YAML frontmatter from MODULE.md content.
+_FRONTMATTER_KEYS = frozenset({b"name", b"version", b"dependencies"})
 
-    Minimal parser: handles name, dependencies list, and version.
-    Does not require pyyaml for simple cases.
+
+def _unquote(value: bytes) -> str:
+    return value.strip().strip(b'"').strip(b"'").decode("utf-8")
+
+
+def _parse_frontmatter_bytes(data: bytes) -> dict[str, Any]:
+    """Extract name, version and dependencies from raw MODULE.md bytes.
+
+    Minimal forward-only scanner: the block is bounded with ``bytes.find``,
+    lines are split and matched as bytes, and only the captured values are
+    decoded. Every other key is skipped without being built. Does not
+    require pyyaml.
     """
-    match = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
-    if not match:
+    if not data.startswith(b"---"):
+        return {}
+    body_start = data.find(b"\n", 3) + 1
+    if body_start == 0 or data[3:body_start].strip():
+        return {}
+    body_end = data.find(b"\n---", body_start)
+    if body_end < 0:
         return {}
 
-    frontmatter = match.group(1)
     result: dict[str, Any] = {}
     collecting_deps = False
 
-    # Parse simple key: value pairs
-    for line in frontmatter.splitlines():
+    for line in data[body_start:body_end].splitlines():
         stripped = line.strip()
 
-        # Check if this is a list item continuation
-        if stripped.startswith("- ") and collecting_deps:
-            dep = stripped[2:].strip().strip('"').strip("'")
-            if dep:
-                result["dependencies"].append(dep)
+        if stripped.startswith(b"- "):
+            # List item continuation; only dependencies items are kept
+            if collecting_deps:
+                dep = _unquote(stripped[2:])
+                if dep:
+                    result["dependencies"].append(sys.intern(dep))
+            continue
+
+        # Any new key (or stray line) stops dependency collection
+        collecting_deps = False
+        key, sep, value = stripped.partition(b":")
+        key = key.rstrip()
+        if not sep or key not in _FRONTMATTER_KEYS:
             continue
 
-        # Check for top-level key: value
-        kv = re.match(r"^(\w[\w-]*)\s*:\s*(.*)", stripped)
-        if kv:
-            collecting_deps = False  # Any new key stops dependency collection
-            key = kv.group(1)
-            value = kv.group(2).strip().strip('"').strip("'")
-            if key == "dependencies":
-                # Could be inline [] or multiline list
-                if value.startswith("[") and value.endswith("]"):
-                    inner = value[1:-1].strip()
-                    if inner:
-                        result["dependencies"] = [
-                            v.strip().strip('"').strip("'") for v in inner.split(",") if v.strip()
-                        ]
-                    else:
-                        result["dependencies"] = []
-                else:
-                    result["dependencies"] = []
-                    collecting_deps = True
-            elif key == "name":
-                result["name"] = value
-            elif key == "version":
-                result["version"] = value
-        elif not stripped.startswith("- "):
-            # Non-list-item, non-key line: stop collecting
-            collecting_deps = False
+        if key == b"version":
+            result["version"] = _unquote(value)
+        elif key == b"name":
+            result["name"] = sys.intern(_unquote(value))
+        else:
+            value = value.strip().strip(b'"').strip(b"'")
+            if value.startswith(b"[") and value.endswith(b"]"):
+                # Inline list: [a, "b"]
+                result["dependencies"] = [
+                    sys.intern(_unquote(v)) for v in value[1:-1].split(b",") if v.strip()
+                ]
+            else:
+                result["dependencies"] = []
+                collecting_deps = True
 
     return result
 
 
-def _load_module_info(module_name: str, modules_dir: Path, core_dir: Path) -> dict[str, Any]:
+# Identity of a MODULE.md as read: (path, st_mtime_ns, st_size)
+_Source = tuple[str, int, int]
+
+
+def _load_module_info(
+    module_name: str, modules_dir: Path, core_dir: Path
+) -> tuple[dict[str, Any], _Source]:
     """Load module info from MODULE.md.
 
     Args:
@@ -71,7 +90,8 @@ def _load_module_info(module_name: str, modules_dir: Path, core_dir: Path) -> di
         core_dir: Path to core/ directory.
 
     Returns:
-        Parsed frontmatter dict.
+        Parsed frontmatter dict, and the file's (path, mtime_ns, size) as
+        stat'ed from the same open file descriptor it was read from.
 
     Raises:
         FileNotFoundError: If module MODULE.md doesn't exist.
@@ -81,12 +101,37 @@ def _load_module_info(module_name: str, modules_dir: Path, core_dir: Path) -> di
     else:
         module_md = modules_dir / module_name / "MODULE.md"
 
-    if not module_md.exists():
+    # Open directly instead of exists() + read: one open, and the raw bytes
+    # go straight to the scanner, so the whole file is never decoded.
+    try:
+        with open(module_md, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+    except FileNotFoundError:
         msg = f"Module not found: {module_name} (no MODULE.md at {module_md})"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
+    source = (os.fspath(module_md), st.st_mtime_ns, st.st_size)
+    return _parse_frontmatter_bytes(data), source
+
+
+def _sources_unchanged(sources: tuple[_Source, ...]) -> bool:
+    """Return True if every MODULE.md still has the recorded mtime and size."""
+    for path, mtime_ns, size in sources:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return False
+    return True
 
-    text = module_md.read_text(encoding="utf-8")
-    return _parse_yaml_frontmatter(text)
+
+# Resolution results keyed by (modules_dir, core_dir, requested names), with
+# the MODULE.md files each one read. A hit is only used after re-stat'ing
+# those files, so an edited manifest is picked up without any TTL.
+_resolve_cache: L0Cache[tuple[tuple[str, ...], tuple[_Source, ...]]] = L0Cache(
+    max_size=256, ttl_seconds=math.inf
+)
 
 
 def resolve_dependencies(
@@ -98,7 +143,9 @@ def resolve_dependencies(
     """Resolve module dependencies in topological order.
 
     Reads MODULE.md files, builds a dependency graph, and returns
-    modules sorted so dependencies come before dependents.
+    modules sorted so dependencies come before dependents. Results are
+    memoized per (directories, requested names) and reused while none of
+    the MODULE.md files they were built from has changed.
 
     Args:
         module_names: List of requested module names.
@@ -115,53 +162,63 @@ def resolve_dependencies(
     if core_dir is None:
         core_dir = modules_dir.parent / "core"
 
-    # Build graph: module_name -> list of dependencies
+    cache_key = "\0".join((os.path.abspath(modules_dir), os.path.abspath(core_dir), *module_names))
+    cached = _resolve_cache.get(cache_key)
+    if cached is not None and _sources_unchanged(cached[1]):
+        return list(cached[0])
+
+    # Build graph: module_name -> list of dependencies (BFS over the closure)
     graph: dict[str, list[str]] = {}
-    to_process = list(module_names)
-    processed: set[str] = set()
+    sources: list[_Source] = []
+    # Module names are interned (here and by the parser) so the repeated
+    # graph/set lookups on names like "core" compare by identity first.
+    to_process = deque(map(sys.intern, module_names))
 
     while to_process:
-        name = to_process.pop(0)
-        if name in processed:
+        name = to_process.popleft()
+        if name in graph:
             continue
-        processed.add(name)
 
-        info = _load_module_info(name, modules_dir, core_dir)
-        deps = info.get("dependencies", [])
+        info, source = _load_module_info(name, modules_dir, core_dir)
+        sources.append(source)
+        deps = list(dict.fromkeys(info.get("dependencies", [])))
+        # A single leaf module is already in order; skip the sort entirely.
+        if not deps and not graph and not to_process:
+            _resolve_cache.set(cache_key, ((name,), (source,)))
+            return [name]
         graph[name] = deps
-
+        to_process.extend(dep for dep in deps if dep not in graph)
+
+    # Kahn's algorithm: iterative, no recursion depth limit. The ready set is
+    # a min-heap, so the result is the lexicographically smallest topological
+    # order and does not depend on the order the modules were requested in.
+    indegree = {name: len(deps) for name, deps in graph.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in graph}
+    for name, deps in graph.items():
         for dep in deps:
-            if dep not in processed:
-                to_process.append(dep)
+            dependents[dep].append(name)
 
-    # Topological sort with cycle detection
+    ready = [name for name, count in indegree.items() if count == 0]
+    heapq.heapify(ready)
     resolved: list[str] = []
-    visiting: set[str] = set()
-    visited: set[str] = set()
-
-    def _visit(node: str) -> None:
-        if node in visited:
-            return
-        if node in visiting:
-            msg = f"Circular dependency detected involving: {node}"
-            raise ValueError(msg)
-
-        visiting.add(node)
-        for dep in graph.get(node, []):
-            _visit(dep)
-        visiting.remove(node)
-        visited.add(node)
+    while ready:
+        node = heapq.heappop(ready)
         resolved.append(node)
+        for dependent in dependents[node]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                heapq.heappush(ready, dependent)
 
-    for name in sorted(graph.keys()):
-        _visit(name)
+    if len(resolved) < len(graph):
+        stuck = sorted(name for name, count in indegree.items() if count > 0)
+        msg = f"Circular dependency detected involving: {', '.join(stuck)}"
+        raise ValueError(msg)
 
+    _resolve_cache.set(cache_key, (tuple(resolved), tuple(sources)))
     return resolved
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: resolve_deps.py MODULE [MODULE ...]", file=sys.stderr)
         print("  Reads MODULE.md from modules/ and core/ directories.", file=sys.stderr)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import ClassVar
@@ -19,36 +20,46 @@ class Match:
 
 @dataclass(frozen=True)
 class PatternSet:
-    """A named collection of regex patterns with optional whitelist exclusions."""
+    """A named collection of regex patterns with optional whitelist exclusions.
+
+    The pattern collections are tuples, so a PatternSet (including the
+    shared, memoized factory results) cannot be modified by its callers.
+    """
 
     name: str
-    patterns: list[re.Pattern[str]]
-    whitelist: list[re.Pattern[str]]
+    patterns: tuple[re.Pattern[str], ...]
+    whitelist: tuple[re.Pattern[str], ...]
 
     def detect(self, text: str) -> list[Match]:
-        """Scan text for pattern matches, excluding whitelisted matches."""
-        # Collect whitelisted spans first
+        """Scan text for pattern matches, excluding whitelisted matches.
+
+        The whitelist is only scanned when some pattern matched, so clean
+        text costs one pass per pattern and nothing more.
+        """
+        hits = [(pattern, m) for pattern in self.patterns for m in pattern.finditer(text)]
+        if not hits:
+            return []
+
+        # Collect whitelisted spans
         whitelisted_spans: set[tuple[int, int]] = set()
         for wp in self.whitelist:
             for wm in wp.finditer(text):
                 whitelisted_spans.add((wm.start(), wm.end()))
 
         matches: list[Match] = []
-        for pattern in self.patterns:
-            for m in pattern.finditer(text):
-                # Check if this match overlaps with any whitelisted span
-                is_whitelisted = any(
-                    m.start() >= ws and m.end() <= we for ws, we in whitelisted_spans
-                )
-                if not is_whitelisted:
-                    matches.append(
-                        Match(
-                            pattern_name=pattern.pattern,
-                            matched_text=m.group(),
-                            start=m.start(),
-                            end=m.end(),
-                        )
+        for pattern, m in hits:
+            start, end = m.span()
+            # Check if this match overlaps with any whitelisted span
+            is_whitelisted = any(start >= ws and end <= we for ws, we in whitelisted_spans)
+            if not is_whitelisted:
+                matches.append(
+                    Match(
+                        pattern_name=pattern.pattern,
+                        matched_text=m.group(),
+                        start=start,
+                        end=end,
                     )
+                )
         return matches
 
 
@@ -56,12 +67,19 @@ class SecretPatterns:
     """Factory for secret detection patterns."""
 
     @staticmethod
+    @functools.cache
     def create() -> PatternSet:
-        """Create a PatternSet for detecting secrets and credentials."""
-        patterns = [
-            # Generic API key assignments
+        """Create a PatternSet for detecting secrets and credentials.
+
+        Built once per process; every call returns the same shared,
+        immutable PatternSet.
+        """
+        patterns = (
+            # Generic API key assignments. The leading lookahead lets the
+            # engine reject every position not starting with a/s before it
+            # tries the four case-insensitive alternatives.
             re.compile(
-                r"""(?:api[_-]?key|secret[_-]?key|access[_-]?token|auth[_-]?token)"""
+                r"""(?=[as])(?:api[_-]?key|secret[_-]?key|access[_-]?token|auth[_-]?token)"""
                 r"""\s*[=:]\s*["'][A-Za-z0-9\-_]{16,}["']""",
                 re.IGNORECASE,
             ),
@@ -78,53 +96,58 @@ class SecretPatterns:
                 r"""(?:password|passwd|pwd)\s*[=:]\s*["'][^\s"']{8,}["']""",
                 re.IGNORECASE,
             ),
-        ]
-        whitelist = [
+        )
+        whitelist = (
             # Placeholder/example values
             re.compile(r"sk-(?:proj-)?xxx+", re.IGNORECASE),
             re.compile(
                 r"""(?:api[_-]?key|secret)\s*[=:]\s*["'](?:your[_-]|example)""", re.IGNORECASE
             ),
-        ]
+        )
         return PatternSet(name="secrets", patterns=patterns, whitelist=whitelist)
 
 
 class PIIPatterns:
     """Factory for PII detection patterns with country-specific support."""
 
-    _COUNTRY_PATTERNS: ClassVar[dict[str, list[re.Pattern[str]]]] = {
-        "BR": [
+    _COUNTRY_PATTERNS: ClassVar[dict[str, tuple[re.Pattern[str], ...]]] = {
+        "BR": (
             # CPF: 000.000.000-00
             re.compile(r"\d{3}\.\d{3}\.\d{3}-\d{2}"),
             # CNPJ: 00.000.000/0000-00
             re.compile(r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}"),
-        ],
-        "US": [
+        ),
+        "US": (
             # SSN: 000-00-0000
             re.compile(r"\d{3}-\d{2}-\d{4}"),
-        ],
-        "EU": [
+        ),
+        "EU": (
             # Email
             re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
             # Phone (international format)
             re.compile(r"\+\d{1,3}\s?\d{4,14}"),
-        ],
+        ),
     }
 
     @classmethod
     def for_country(cls, country_code: str) -> PatternSet:
         """Create a PatternSet for PII detection for a specific country."""
-        patterns = cls._COUNTRY_PATTERNS.get(country_code.upper(), [])
-        return PatternSet(name=f"pii_{country_code.lower()}", patterns=patterns, whitelist=[])
+        patterns = cls._COUNTRY_PATTERNS.get(country_code.upper(), ())
+        return PatternSet(name=f"pii_{country_code.lower()}", patterns=patterns, whitelist=())
 
 
 class BashSafetyPatterns:
     """Factory for detecting dangerous bash commands."""
 
     @staticmethod
+    @functools.cache
     def create() -> PatternSet:
-        """Create a PatternSet for dangerous shell command detection."""
-        patterns = [
+        """Create a PatternSet for dangerous shell command detection.
+
+        Built once per process; every call returns the same shared,
+        immutable PatternSet.
+        """
+        patterns = (
             # rm -rf / or rm -rf /*
             re.compile(r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)?-*r[a-zA-Z]*f?\s+/(?:\s|$|\*)"),
             re.compile(r"rm\s+(-[a-zA-Z]*r[a-zA-Z]*\s+)?-*f[a-zA-Z]*r?\s+/(?:\s|$|\*)"),
@@ -140,5 +163,5 @@ class BashSafetyPatterns:
             re.compile(r":\(\)\{.*\|.*\}"),
             # Direct write to /dev/sda etc.
             re.compile(r">\s*/dev/(?:sd|hd|nvme|vd)[a-z]"),
-        ]
-        return PatternSet(name="bash_safety", patterns=patterns, whitelist=[])
+        )
+        return PatternSet(name="bash_safety", patterns=patterns, whitelist=())
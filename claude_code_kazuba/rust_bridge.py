@@ -14,14 +14,18 @@ Usage:
 
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel, Field
 
 from claude_code_kazuba.patterns import BashSafetyPatterns, PatternSet, SecretPatterns
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 # ---------------------------------------------------------------------------
 # Try importing the compiled Rust extension (optional, fails gracefully)
 # ---------------------------------------------------------------------------
@@ -102,8 +106,12 @@ _PYTHON_SECRETS: PatternSet = SecretPatterns.create()
 _PYTHON_BASH: PatternSet = BashSafetyPatterns.create()
 
 
-def _python_check_secrets(content: str) -> list[SecretHit]:
-    """Detect secrets using the pure-Python pattern engine."""
+def _python_check_secrets(content: str, file_path: str = "") -> list[SecretHit]:
+    """Detect secrets using the pure-Python pattern engine.
+
+    ``file_path`` is accepted for signature parity with the Rust backend
+    and is not used.
+    """
     matches = _PYTHON_SECRETS.detect(content)
     return [
         SecretHit(
@@ -130,6 +138,35 @@ def _python_match_patterns(text: str, pattern_set: PatternSet) -> list[PatternHi
     ]
 
 
+# Literal checks applied after the BashSafetyPatterns regexes
+_DANGEROUS_LITERALS: tuple[tuple[str, str, str], ...] = (
+    ("rm -rf /", "high", "Recursive delete of root filesystem"),
+    ("rm -rf /*", "high", "Recursive delete of root filesystem wildcard"),
+    ("sudo rm -rf", "high", "Privileged recursive delete"),
+    ("| sh", "high", "Pipe to shell — potential code injection"),
+    ("| bash", "high", "Pipe to bash — potential code injection"),
+    ("dd of=/dev/", "high", "Direct write to device"),
+    ("mkfs.", "high", "Filesystem format — data destruction"),
+    (":(){ :|:& };:", "high", "Fork bomb"),
+    ("chmod 777", "medium", "World-writable permissions"),
+    ("> /etc/", "medium", "Writing to system config directory"),
+    ("> /usr/", "medium", "Writing to system binaries directory"),
+)
+
+# Every bash-safety regex and dangerous literal contains at least one of
+# these substrings, so a command with none of them is safe without running
+# the regex engine. Keep in sync when adding patterns.
+_BASH_TRIGGERS = ("rm", "chmod", "dd", "mkfs", "|", ">")
+
+_SAFE_BASH = BashValidation(
+    allowed=True,
+    reason="Command is safe",
+    severity=None,
+    matched_pattern=None,
+    backend="python",
+)
+
+
 def _python_validate_bash(command: str) -> BashValidation:
     """Validate bash command safety using pure-Python patterns."""
     if not command.strip():
@@ -141,6 +178,9 @@ def _python_validate_bash(command: str) -> BashValidation:
             backend="python",
         )
 
+    if not any(trigger in command for trigger in _BASH_TRIGGERS):
+        return _SAFE_BASH
+
     # Check safe patterns first (patterns module has bash safety)
     hits = _PYTHON_BASH.detect(command)
     if hits:
@@ -154,21 +194,7 @@ def _python_validate_bash(command: str) -> BashValidation:
         )
 
     # Additional Python-level checks for common dangerous patterns
-    dangerous_literals = [
-        ("rm -rf /", "high", "Recursive delete of root filesystem"),
-        ("rm -rf /*", "high", "Recursive delete of root filesystem wildcard"),
-        ("sudo rm -rf", "high", "Privileged recursive delete"),
-        ("| sh", "high", "Pipe to shell — potential code injection"),
-        ("| bash", "high", "Pipe to bash — potential code injection"),
-        ("dd of=/dev/", "high", "Direct write to device"),
-        ("mkfs.", "high", "Filesystem format — data destruction"),
-        (":(){ :|:& };:", "high", "Fork bomb"),
-        ("chmod 777", "medium", "World-writable permissions"),
-        ("> /etc/", "medium", "Writing to system config directory"),
-        ("> /usr/", "medium", "Writing to system binaries directory"),
-    ]
-
-    for pattern_str, severity, reason in dangerous_literals:
+    for pattern_str, severity, reason in _DANGEROUS_LITERALS:
         if pattern_str in command:
             return BashValidation(
                 allowed=False,
@@ -178,13 +204,7 @@ def _python_validate_bash(command: str) -> BashValidation:
                 backend="python",
             )
 
-    return BashValidation(
-        allowed=True,
-        reason="Command is safe",
-        severity=None,
-        matched_pattern=None,
-        backend="python",
-    )
+    return _SAFE_BASH
 
 
 # ---------------------------------------------------------------------------
@@ -224,28 +244,52 @@ class RustBridge:
     """Facade providing unified access to Rust or Python backend.
 
     Use RustBridge.instance() to obtain the singleton.
+
+    The backend functions are chosen once, in ``__init__``, so each call
+    dispatches straight to them instead of re-testing the backend. The
+    clock (``time.perf_counter_ns``, integer nanoseconds) is only read in
+    benchmark mode.
     """
 
     _singleton: RustBridge | None = None
+    _singleton_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, config: RustBridgeConfig | None = None) -> None:
         self._config = config or RustBridgeConfig()
         self._use_rust = _RUST_AVAILABLE and self._config.prefer_rust
         self._benchmarks: list[BenchmarkResult] = []
+        self._check_secrets_impl: Callable[[str, str], list[SecretHit]]
+        self._validate_bash_impl: Callable[[str], BashValidation]
+        if self._use_rust:
+            self._check_secrets_impl = _rust_check_secrets
+            self._validate_bash_impl = _rust_validate_bash
+        else:
+            self._check_secrets_impl = _python_check_secrets
+            self._validate_bash_impl = _python_validate_bash
 
     # ---- Singleton -------------------------------------------------------
 
     @classmethod
     def instance(cls, config: RustBridgeConfig | None = None) -> RustBridge:
-        """Return (or create) the process-level singleton."""
-        if cls._singleton is None:
-            cls._singleton = cls(config)
-        return cls._singleton
+        """Return (or create) the process-level singleton.
+
+        Once created, the singleton is returned without taking a lock; only
+        the first call(s) synchronize, so exactly one instance is built
+        even when threads race to create it.
+        """
+        inst = cls._singleton
+        if inst is not None:
+            return inst
+        with cls._singleton_lock:
+            if cls._singleton is None:
+                cls._singleton = cls(config)
+            return cls._singleton
 
     @classmethod
     def reset_singleton(cls) -> None:
         """Reset singleton (used in tests)."""
-        cls._singleton = None
+        with cls._singleton_lock:
+            cls._singleton = None
 
     # ---- Properties ------------------------------------------------------
 
@@ -279,12 +323,9 @@ class RustBridge:
         if len(content.encode()) > self._config.max_content_bytes:
             content = content[: self._config.max_content_bytes]
 
-        t0 = time.perf_counter_ns()
+        t0 = time.perf_counter_ns() if self._config.benchmark_mode else 0
         try:
-            if self._use_rust:
-                result = _rust_check_secrets(content, file_path)
-            else:
-                result = _python_check_secrets(content)
+            result = self._check_secrets_impl(content, file_path)
         except Exception:
             if self._config.fallback_on_error:
                 result = _python_check_secrets(content)
@@ -310,7 +351,7 @@ class RustBridge:
             List of PatternHit instances.
         """
         ps = pattern_set or _PYTHON_SECRETS
-        t0 = time.perf_counter_ns()
+        t0 = time.perf_counter_ns() if self._config.benchmark_mode else 0
         result = _python_match_patterns(text, ps)
         if self._config.benchmark_mode:
             self._benchmarks.append(
@@ -329,12 +370,9 @@ class RustBridge:
         Returns:
             BashValidation with allowed=True/False and reason.
         """
-        t0 = time.perf_counter_ns()
+        t0 = time.perf_counter_ns() if self._config.benchmark_mode else 0
         try:
-            if self._use_rust:
-                result = _rust_validate_bash(command)
-            else:
-                result = _python_validate_bash(command)
+            result = self._validate_bash_impl(command)
         except Exception:
             if self._config.fallback_on_error:
                 result = _python_validate_bash(command)
@@ -3,7 +3,8 @@
 Provides structured tracing with nested spans for recording hook
 execution flow. Each span tracks duration, child spans, and events.
 
-Thread-local storage ensures span stacks do not collide across threads.
+Per-thread span stacks (keyed by thread ident) ensure spans do not
+collide across threads.
 
 Usage:
     tm = TraceManager("my-session")
@@ -33,7 +34,7 @@ class TraceSpan:
 
     Args:
         name: Human-readable span name.
-        start_time: Monotonic timestamp when span started.
+        start_time: Monotonic (``time.perf_counter``) timestamp when span started.
         duration_ms: Duration in milliseconds.
         children: Tuple of child spans (immutable).
         metadata: Additional metadata dict.
@@ -46,46 +47,65 @@ class TraceSpan:
     metadata: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class _MutableSpan:
     """Internal mutable span used during recording.
 
-    Converted to frozen TraceSpan when the span ends.
+    Converted to frozen TraceSpan when the span ends. Children have already
+    ended by then, so they are collected as finished TraceSpans.
     """
 
     name: str
     start_time: float
-    children: list[_MutableSpan] = field(default_factory=list)  # type: ignore[assignment]
-    events: list[dict[str, Any]] = field(default_factory=list)  # type: ignore[assignment]
+    children: list[TraceSpan] = field(default_factory=list[TraceSpan])
+    events: list[dict[str, Any]] = field(default_factory=list[dict[str, Any]])
 
     def to_span(self, end_time: float) -> TraceSpan:
         """Convert to immutable TraceSpan with computed duration."""
-        duration_ms = (end_time - self.start_time) * 1000.0
         return TraceSpan(
             name=self.name,
             start_time=self.start_time,
-            duration_ms=duration_ms,
-            children=tuple(c.to_span(end_time) for c in self.children),
-            metadata={"events": list(self.events)},
+            duration_ms=(end_time - self.start_time) * 1000.0,
+            children=tuple(self.children),
+            metadata={"events": self.events},
         )
 
 
-def _span_to_dict(span: TraceSpan) -> dict[str, Any]:
-    """Recursively convert a TraceSpan to a serializable dict."""
+def _span_fields(span: TraceSpan) -> dict[str, Any]:
+    """Serializable dict of one span, with its children list still empty."""
     return {
         "name": span.name,
         "start_time": span.start_time,
         "duration_ms": span.duration_ms,
-        "children": [_span_to_dict(c) for c in span.children],
+        "children": [],
         "events": span.metadata.get("events", []),
     }
 
 
+def _span_to_dict(span: TraceSpan) -> dict[str, Any]:
+    """Convert a TraceSpan tree to a serializable dict.
+
+    Walks the tree with an explicit stack, so nesting depth is not bounded
+    by the interpreter's recursion limit.
+    """
+    root = _span_fields(span)
+    stack = [(span, root)]
+    while stack:
+        node, out = stack.pop()
+        children = out["children"]
+        for child in node.children:
+            child_out = _span_fields(child)
+            children.append(child_out)
+            stack.append((child, child_out))
+    return root
+
+
 class TraceManager:
     """Trace tree manager for hook execution debugging.
 
     Records nested spans with duration tracking and event recording.
-    Uses thread-local storage for span stacks to be safe across threads.
+    Keeps one span stack per thread, keyed by ``threading.get_ident()``, to
+    be safe across threads.
 
     Args:
         session_name: Name for this trace session.
@@ -95,25 +115,30 @@ class TraceManager:
         self._session_name = session_name
         self._completed_spans: list[TraceSpan] = []
         self._lock = threading.Lock()
-        self._local = threading.local()
+        # Thread ident -> open span stack; an entry exists only while that
+        # thread has a span open, so finished threads leave nothing behind.
+        self._stacks: dict[int, list[_MutableSpan]] = {}
 
     @property
     def session_name(self) -> str:
         """Return the session name."""
         return self._session_name
 
-    def _get_stack(self) -> list[_MutableSpan]:
-        """Get the thread-local span stack."""
-        if not hasattr(self._local, "stack"):
-            self._local.stack = []
-        return self._local.stack  # type: ignore[no-any-return]
+    def _get_stack(self, tid: int) -> list[_MutableSpan]:
+        """Get (creating if needed) the span stack of thread ``tid``."""
+        stack = self._stacks.get(tid)
+        if stack is None:
+            with self._lock:
+                stack = self._stacks.setdefault(tid, [])
+        return stack
 
     @contextmanager
     def start_span(self, name: str) -> Generator[_MutableSpan, None, None]:
         """Start a new span as a context manager.
 
         If there is a current active span, the new span becomes its child.
-        Otherwise it becomes a root span.
+        Otherwise it becomes a root span. Each span is frozen when it exits,
+        so its duration ends at its own exit rather than its root's.
 
         Args:
             name: Human-readable name for the span.
@@ -121,23 +146,22 @@ class TraceManager:
         Yields:
             The mutable span object (for adding events).
         """
-        stack = self._get_stack()
-        span = _MutableSpan(name=name, start_time=time.monotonic())
-
-        if stack:
-            stack[-1].children.append(span)
-
+        tid = threading.get_ident()
+        stack = self._get_stack(tid)
+        span = _MutableSpan(name, time.perf_counter())
         stack.append(span)
         try:
             yield span
         finally:
             stack.pop()
-            if not stack:
-                # Root span completed — convert and store
-                end_time = time.monotonic()
-                completed = span.to_span(end_time)
+            completed = span.to_span(time.perf_counter())
+            if stack:
+                stack[-1].children.append(completed)
+            else:
+                # Root span completed — store it and drop the empty stack
                 with self._lock:
                     self._completed_spans.append(completed)
+                    del self._stacks[tid]
 
     def record(self, event_name: str, metadata: dict[str, Any]) -> None:
         """Record an event in the current active span.
@@ -146,7 +170,7 @@ class TraceManager:
             event_name: Name of the event.
             metadata: Additional data for the event.
         """
-        stack = self._get_stack()
+        stack = self._stacks.get(threading.get_ident())
         if stack:
             stack[-1].events.append({"name": event_name, "metadata": metadata})
 
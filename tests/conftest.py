@@ -2,11 +2,305 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
+import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import pytest
+import yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# LibYAML's C loader is ~10x faster than the pure-Python SafeLoader; fall back
+# when PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+def load_yaml(source: str | bytes) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(source, Loader=_YamlLoader)
+
+
+_FRONTMATTER_READ_SIZE = 8192
+
+# Opening and closing ``---`` on their own lines, LF or CRLF, in one C-level match.
+_FRONTMATTER_RE = re.compile(rb"\A---\r?\n(.*?)\r?\n---(?:\r?\n|\Z)", re.DOTALL)
+
+# Parsed files are cached for the whole session, keyed by (path, mtime_ns) so
+# an edited file is re-parsed. Callers must treat the results as read-only.
+
+
+@functools.cache
+def _load_yaml_file(path: str, mtime_ns: int) -> Any:
+    # Hand LibYAML the raw bytes: it decodes UTF-8 itself in C.
+    return load_yaml(Path(path).read_bytes())
+
+
+@functools.cache
+def _extract_frontmatter(path: str, mtime_ns: int) -> dict[str, Any] | None:
+    # Frontmatter sits at the top of the file: match a bounded prefix and only
+    # keep reading while the opening delimiter is there but the closing one
+    # has not been seen yet.
+    with open(path, "rb") as f:
+        head = f.read(_FRONTMATTER_READ_SIZE)
+        match = _FRONTMATTER_RE.match(head)
+        while match is None and head.startswith(b"---"):
+            more = f.read(_FRONTMATTER_READ_SIZE)
+            if not more:
+                return None
+            head += more
+            match = _FRONTMATTER_RE.match(head)
+    if match is None:
+        return None
+    try:
+        return load_yaml(match.group(1))
+    except yaml.YAMLError:  # Includes ReaderError for invalid UTF-8.
+        return None
+
+
+@functools.cache
+def _line_count(path: str, mtime_ns: int) -> int:
+    data = Path(path).read_bytes()
+    return data.count(b"\n") + (0 if not data or data.endswith(b"\n") else 1)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file once per session (re-parsed if its mtime changes)."""
+    return _load_yaml_file(str(path), path.stat().st_mtime_ns)
+
+
+def extract_frontmatter(path: Path) -> dict[str, Any] | None:
+    """Extract the ``---`` delimited YAML frontmatter of a markdown file, cached per session."""
+    return _extract_frontmatter(str(path), path.stat().st_mtime_ns)
+
+
+def line_count(path: Path) -> int:
+    """Count a file's lines on raw bytes (no decode, no line list), cached per session."""
+    return _line_count(str(path), path.stat().st_mtime_ns)
+
+
+# Directories never worth descending into when walking a source tree.
+_SKIP_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+
+
+def scandir_recursive(
+    root: Path,
+    *,
+    name: str | None = None,
+    suffix: str | tuple[str, ...] | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under ``root`` via an explicit-stack ``os.scandir`` walk.
+
+    Unlike ``Path.rglob`` this filters on ``entry.name`` before building any
+    ``Path`` and reuses the directory entry's cached type information.
+
+    Args:
+        root: Directory to walk.
+        name: If given, only yield files with exactly this name.
+        suffix: If given, only yield files whose name ends with it (or any of them).
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif (name is None or entry.name == name) and (
+                    suffix is None or entry.name.endswith(suffix)
+                ):
+                    yield entry
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Public so phase conftests and collection-time manifests build paths from the
+# same root the session indexes are keyed on.
+MODULES_DIR = _PROJECT_ROOT / "claude_code_kazuba" / "data" / "modules"
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Return the project root directory, resolved once per session."""
+    return _PROJECT_ROOT
+
+
+@pytest.fixture(scope="session")
+def modules_dir() -> Path:
+    """Return the bundled modules directory (``claude_code_kazuba/data/modules``)."""
+    return MODULES_DIR
+
+
+@pytest.fixture(scope="session")
+def file_sizes() -> dict[str, int]:
+    """Map every file under the modules tree to its size, from one scandir walk.
+
+    Existence checks become ``str(path) in file_sizes`` instead of a fresh
+    ``stat`` per assertion; sizes come from the cached ``DirEntry.stat()``.
+    """
+    return {entry.path: entry.stat().st_size for entry in scandir_recursive(MODULES_DIR)}
+
+
+_YAML_INDEX_CACHE_KEY = "kazuba/yaml_index"
+
+
+def _json_round_trips(doc: Any) -> bool:
+    try:
+        return json.loads(json.dumps(doc)) == doc
+    except (TypeError, ValueError):
+        return False
+
+
+@pytest.fixture(scope="session")
+def yaml_index(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Map every YAML file under the modules tree (relative POSIX path) to its document.
+
+    Parsed documents are stored as JSON in pytest's cache (``.pytest_cache``),
+    keyed by a digest of every file's path, mtime and size, so an unchanged
+    tree is a single ``json`` load instead of a YAML parse per file. Documents
+    that do not survive a JSON round-trip (non-string keys, dates) are not
+    cached and are parsed each run. Files that fail to parse are left out.
+    """
+    paths = {
+        Path(e.path).relative_to(MODULES_DIR).as_posix(): Path(e.path)
+        for e in scandir_recursive(MODULES_DIR, suffix=(".yaml", ".yml"))
+    }
+    digest = hashlib.sha1(usedforsecurity=False)
+    for rel in sorted(paths):
+        st = paths[rel].stat()
+        digest.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    key = digest.hexdigest()
+
+    # ``config.cache`` is absent when the cacheprovider plugin is disabled.
+    cache = getattr(request.config, "cache", None)
+    cached = cache.get(_YAML_INDEX_CACHE_KEY, None) if cache is not None else None
+    docs: dict[str, Any] = {}
+    if isinstance(cached, dict) and cached.get("key") == key:
+        docs.update(cached["docs"])
+
+    fresh: dict[str, Any] = {}
+    for rel in sorted(paths.keys() - docs.keys()):
+        try:
+            fresh[rel] = load_yaml_file(paths[rel])
+        except (OSError, yaml.YAMLError):
+            continue  # Validity is reported by the per-file YAML tests.
+    docs.update(fresh)
+
+    if cache is not None and (cached is None or cached.get("key") != key):
+        cacheable = {rel: doc for rel, doc in docs.items() if _json_round_trips(doc)}
+        cache.set(_YAML_INDEX_CACHE_KEY, {"key": key, "docs": cacheable})
+    return docs
+
+
+@pytest.fixture(scope="session")
+def modules_tree_index() -> dict[str, dict[str, tuple[Path, ...]]]:
+    """Index every markdown file under the modules tree in a single walk.
+
+    Returns a mapping of kind (``"skills"``, ``"agents"``, ``"commands"``,
+    ``"modules"``) to ``{name: paths}``. Paths are tuples so callers can still
+    detect duplicate names.
+    """
+    index: dict[str, dict[str, list[Path]]] = {
+        "skills": {},
+        "agents": {},
+        "commands": {},
+        "modules": {},
+    }
+    for entry in scandir_recursive(MODULES_DIR, suffix=".md"):
+        path = Path(entry.path)
+        parent = path.parent.name
+        if entry.name == "SKILL.md":
+            index["skills"].setdefault(parent, []).append(path)
+        elif entry.name == "MODULE.md":
+            index["modules"].setdefault(parent, []).append(path)
+        elif parent == "agents":
+            index["agents"].setdefault(path.stem, []).append(path)
+        elif parent == "commands":
+            index["commands"].setdefault(path.stem, []).append(path)
+    return {
+        kind: {name: tuple(sorted(paths)) for name, paths in entries.items()}
+        for kind, entries in index.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def skill_index(
+    modules_tree_index: dict[str, dict[str, tuple[Path, ...]]],
+) -> dict[str, tuple[Path, ...]]:
+    """Map skill directory name to its SKILL.md path(s)."""
+    return modules_tree_index["skills"]
+
+
+@pytest.fixture(scope="session")
+def agent_index(
+    modules_tree_index: dict[str, dict[str, tuple[Path, ...]]],
+) -> dict[str, tuple[Path, ...]]:
+    """Map agent name to its ``agents/<name>.md`` path(s)."""
+    return modules_tree_index["agents"]
+
+
+@pytest.fixture(scope="session")
+def command_index(
+    modules_tree_index: dict[str, dict[str, tuple[Path, ...]]],
+) -> dict[str, tuple[Path, ...]]:
+    """Map command name to its ``commands/<name>.md`` path(s)."""
+    return modules_tree_index["commands"]
+
+
+@pytest.fixture(scope="session")
+def module_md_index(
+    modules_tree_index: dict[str, dict[str, tuple[Path, ...]]],
+) -> dict[str, tuple[Path, ...]]:
+    """Map module directory name to its MODULE.md path(s)."""
+    return modules_tree_index["modules"]
+
+
+@pytest.fixture(scope="session")
+def frontmatter_index(
+    modules_tree_index: dict[str, dict[str, tuple[Path, ...]]],
+) -> dict[Path, dict[str, Any] | None]:
+    """Map every indexed markdown file to its parsed frontmatter (``None`` if absent/invalid).
+
+    Parsed once per session, so batch checks over all skills or agents are
+    dict lookups rather than a read and parse per file per test.
+    """
+    return {
+        path: extract_frontmatter(path)
+        for entries in modules_tree_index.values()
+        for paths in entries.values()
+        for path in paths
+    }
+
+
+class ModuleManifest(NamedTuple):
+    """A MODULE.md file as seen by the session indexes."""
+
+    path: Path
+    size: int
+    frontmatter: dict[str, Any] | None
+
+
+@pytest.fixture(scope="session")
+def module_manifest_index(
+    module_md_index: dict[str, tuple[Path, ...]],
+    file_sizes: dict[str, int],
+    frontmatter_index: dict[Path, dict[str, Any] | None],
+) -> dict[str, ModuleManifest]:
+    """Map module directory name to its MODULE.md path, size and frontmatter.
+
+    Assembled from the other session indexes, so no file is opened again.
+    """
+    return {
+        name: ModuleManifest(paths[0], file_sizes[str(paths[0])], frontmatter_index[paths[0]])
+        for name, paths in module_md_index.items()
+    }
 
 
 @pytest.fixture
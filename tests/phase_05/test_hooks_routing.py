@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.util
 import json
+import math
 import sys
-import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -35,6 +36,12 @@ km = _import_from_path("knowledge_manager", _hooks_dir / "knowledge_manager.py")
 ct = _import_from_path("compliance_tracker", _hooks_dir / "compliance_tracker.py")
 
 
+@functools.lru_cache(maxsize=256)
+def _classify(prompt: str) -> Any:
+    """Classify a prompt once per session; repeat runs reuse the result."""
+    return cr.classify_complexity(prompt)
+
+
 # --- Module manifest tests ---
 
 
@@ -95,51 +102,45 @@ class TestCILARouter:
     """Test CILA complexity classification."""
 
     def test_trivial_prompt_l0(self) -> None:
-        result = cr.classify_complexity("yes")
+        result = _classify("yes")
         assert result.level == 0
 
     def test_simple_prompt_l1(self) -> None:
-        result = cr.classify_complexity("read main.py")
+        result = _classify("read main.py")
         assert result.level <= 1
 
     def test_standard_prompt_l2(self) -> None:
-        result = cr.classify_complexity(
-            "update the config and then add a new setting to the module"
-        )
+        result = _classify("update the config and then add a new setting to the module")
         assert result.level >= 2
 
     def test_complex_prompt_l3(self) -> None:
-        result = cr.classify_complexity("refactor all the modules to use the new pattern")
+        result = _classify("refactor all the modules to use the new pattern")
         assert result.level >= 3
 
     def test_advanced_prompt_l4(self) -> None:
-        result = cr.classify_complexity("design a new architecture for the migration system")
+        result = _classify("design a new architecture for the migration system")
         assert result.level >= 4
 
     def test_expert_prompt_l5(self) -> None:
-        result = cr.classify_complexity(
+        result = _classify(
             "research different approaches and compare evaluation options and alternatives"
         )
         assert result.level >= 5
 
     def test_extreme_prompt_l6(self) -> None:
-        result = cr.classify_complexity(
-            "use a team of parallel agents for a full rewrite from scratch"
-        )
+        result = _classify("use a team of parallel agents for a full rewrite from scratch")
         assert result.level >= 5  # L5 or L6
 
     def test_cila_levels_defined(self) -> None:
         assert len(cr.CILA_LEVELS) == 7
-        for i in range(7):
-            assert i in cr.CILA_LEVELS
+        assert set(range(7)) <= cr.CILA_LEVELS.keys()
 
     def test_cila_routing_defined(self) -> None:
         assert len(cr.CILA_ROUTING) == 7
-        for i in range(7):
-            assert i in cr.CILA_ROUTING
+        assert set(range(7)) <= cr.CILA_ROUTING.keys()
 
     def test_classification_returns_result(self) -> None:
-        result = cr.classify_complexity("hello")
+        result = _classify("hello")
         assert isinstance(result, cr.CILAResult)
         assert isinstance(result.level, int)
         assert 0 <= result.level <= 6
@@ -155,9 +156,9 @@ class TestCILARouter:
 
     def test_word_count_boost(self) -> None:
         """Long prompts should get a complexity boost."""
-        short = cr.classify_complexity("fix the bug")
+        short = _classify("fix the bug")
         long_prompt = "fix the bug " + "with additional context about the problem " * 30
-        long_result = cr.classify_complexity(long_prompt)
+        long_result = _classify(long_prompt)
         assert long_result.level >= short.level
 
     def test_caching_works(self) -> None:
@@ -171,6 +172,20 @@ class TestCILARouter:
 # --- Knowledge manager tests ---
 
 
+@pytest.fixture(scope="module")
+def claude_md_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project directory containing only CLAUDE.md, shared by read-only tests."""
+    project = tmp_path_factory.mktemp("km")
+    (project / "CLAUDE.md").write_text("# Test Project\nSome docs.")
+    return project
+
+
+@pytest.fixture(scope="module")
+def empty_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project directory with no docs, shared by read-only tests."""
+    return tmp_path_factory.mktemp("empty")
+
+
 class TestKnowledgeManager:
     """Test 3-tier knowledge injection."""
 
@@ -178,30 +193,53 @@ class TestKnowledgeManager:
         result = km.tier1_cache_lookup("Read", "/nonexistent/path.py")
         assert result is None
 
-    def test_tier2_project_docs(self, tmp_path: Path) -> None:
-        (tmp_path / "CLAUDE.md").write_text("# Test Project\nSome docs.")
-        entries = km.tier2_project_docs(str(tmp_path))
+    def test_tier2_project_docs(self, claude_md_dir: Path) -> None:
+        entries = km.tier2_project_docs(str(claude_md_dir))
         assert len(entries) >= 1
         assert entries[0].tier == 2
         assert entries[0].source == "CLAUDE.md"
 
-    def test_tier2_no_docs(self, tmp_path: Path) -> None:
-        entries = km.tier2_project_docs(str(tmp_path))
+    def test_tier2_no_docs(self, empty_project_dir: Path) -> None:
+        entries = km.tier2_project_docs(str(empty_project_dir))
         assert len(entries) == 0
 
+    def test_tier2_nested_docs_in_list_order(self, tmp_path: Path) -> None:
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "ARCHITECTURE.md").write_text("# Architecture")
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "CLAUDE.md").write_text("# Nested")
+        (tmp_path / "README.md").write_text("# Readme")
+        (tmp_path / "CONTRIBUTING.md").mkdir()  # A directory is not a doc.
+        entries = km.tier2_project_docs(str(tmp_path))
+        assert [e.source for e in entries] == [
+            ".claude/CLAUDE.md",
+            "README.md",
+            "docs/ARCHITECTURE.md",
+        ]
+
+    def test_tier2_empty_cwd_is_process_cwd(
+        self, claude_md_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(claude_md_dir)
+        entries = km.tier2_project_docs("")
+        assert [e.source for e in entries] == ["CLAUDE.md"]
+
+    def test_tier2_missing_dir(self, tmp_path: Path) -> None:
+        entries = km.tier2_project_docs(str(tmp_path / "does-not-exist"))
+        assert entries == []
+
     def test_tier3_external_hint(self) -> None:
         hint = km.tier3_external_hint("WebSearch")
         assert "[knowledge-manager]" in hint
         assert "WebSearch" in hint
 
-    def test_build_knowledge_context_with_docs(self, tmp_path: Path) -> None:
-        (tmp_path / "CLAUDE.md").write_text("# Project")
-        ctx = km.build_knowledge_context("Read", "main.py", str(tmp_path))
+    def test_build_knowledge_context_with_docs(self, claude_md_dir: Path) -> None:
+        ctx = km.build_knowledge_context("Read", "main.py", str(claude_md_dir))
         assert ctx is not None
         assert "[knowledge-manager]" in ctx
 
-    def test_build_knowledge_context_no_match(self, tmp_path: Path) -> None:
-        ctx = km.build_knowledge_context("SomeUnknownTool", "", str(tmp_path))
+    def test_build_knowledge_context_no_match(self, empty_project_dir: Path) -> None:
+        ctx = km.build_knowledge_context("SomeUnknownTool", "", str(empty_project_dir))
         assert ctx is None
 
     def test_knowledge_entry_dataclass(self) -> None:
@@ -213,12 +251,18 @@ class TestKnowledgeManager:
 # --- Compliance tracker tests ---
 
 
+@pytest.fixture(scope="module")
+def frozen_ts() -> float:
+    """Fixed event timestamp: deterministic and avoids a clock read per event."""
+    return 1_700_000_000.0
+
+
 class TestComplianceTracker:
     """Test compliance tracking and audit logging."""
 
-    def test_compliance_event_creation(self) -> None:
+    def test_compliance_event_creation(self, frozen_ts: float) -> None:
         event = ct.ComplianceEvent(
-            timestamp=time.time(),
+            timestamp=frozen_ts,
             session_id="test-001",
             tool_name="Write",
             hook_event="PostToolUse",
@@ -227,10 +271,10 @@ class TestComplianceTracker:
         assert event.tool_name == "Write"
         assert event.decision == "allow"
 
-    def test_compliance_stats_record(self) -> None:
+    def test_compliance_stats_record(self, frozen_ts: float) -> None:
         stats = ct.ComplianceStats()
         event = ct.ComplianceEvent(
-            timestamp=time.time(),
+            timestamp=frozen_ts,
             session_id="test",
             tool_name="Write",
             hook_event="PostToolUse",
@@ -241,10 +285,10 @@ class TestComplianceTracker:
         assert stats.allow_count == 1
         assert stats.tool_counts["Write"] == 1
 
-    def test_compliance_stats_block(self) -> None:
+    def test_compliance_stats_block(self, frozen_ts: float) -> None:
         stats = ct.ComplianceStats()
         event = ct.ComplianceEvent(
-            timestamp=time.time(),
+            timestamp=frozen_ts,
             session_id="test",
             tool_name="Bash",
             hook_event="PostToolUse",
@@ -253,25 +297,26 @@ class TestComplianceTracker:
         stats.record(event)
         assert stats.block_count == 1
 
-    def test_compliance_score_perfect(self) -> None:
+    def test_compliance_score_perfect(self, frozen_ts: float) -> None:
         stats = ct.ComplianceStats()
+        # ComplianceEvent is frozen and record() does not mutate it, so one
+        # instance can be recorded repeatedly.
+        event = ct.ComplianceEvent(
+            timestamp=frozen_ts,
+            session_id="test",
+            tool_name="Read",
+            hook_event="PostToolUse",
+            decision="allow",
+        )
         for _ in range(5):
-            stats.record(
-                ct.ComplianceEvent(
-                    timestamp=time.time(),
-                    session_id="test",
-                    tool_name="Read",
-                    hook_event="PostToolUse",
-                    decision="allow",
-                )
-            )
+            stats.record(event)
         assert stats.compliance_score == 1.0
 
-    def test_compliance_score_mixed(self) -> None:
+    def test_compliance_score_mixed(self, frozen_ts: float) -> None:
         stats = ct.ComplianceStats()
         stats.record(
             ct.ComplianceEvent(
-                timestamp=time.time(),
+                timestamp=frozen_ts,
                 session_id="t",
                 tool_name="A",
                 hook_event="PostToolUse",
@@ -280,14 +325,46 @@ class TestComplianceTracker:
         )
         stats.record(
             ct.ComplianceEvent(
-                timestamp=time.time(),
+                timestamp=frozen_ts,
                 session_id="t",
                 tool_name="B",
                 hook_event="PostToolUse",
                 decision="block",
             )
         )
-        assert stats.compliance_score == 0.5
+        assert math.isclose(stats.compliance_score, stats.allow_count / stats.total_events)
+        assert math.isclose(stats.compliance_score, 0.5)
+
+    def test_record_batch_matches_record_loop(self, frozen_ts: float) -> None:
+        decisions = ("allow", "block", "error", "deny")
+        tools = ("Read", "Write", "Bash", "Edit", "Grep")
+        events = [
+            ct.ComplianceEvent(
+                timestamp=frozen_ts,
+                session_id="batch",
+                tool_name=tools[i % len(tools)],
+                hook_event="PostToolUse",
+                decision=decisions[i % len(decisions)],
+            )
+            for i in range(1000)
+        ]
+        batched = ct.ComplianceStats()
+        batched.record_batch(events)
+        looped = ct.ComplianceStats()
+        for event in events:
+            looped.record(event)
+
+        assert batched.total_events == looped.total_events == 1000
+        assert batched.allow_count == looped.allow_count
+        assert batched.block_count == looped.block_count
+        assert batched.error_count == looped.error_count
+        assert batched.tool_counts == looped.tool_counts
+
+    def test_record_batch_empty(self) -> None:
+        stats = ct.ComplianceStats()
+        stats.record_batch([])
+        assert stats.total_events == 0
+        assert stats.tool_counts == {}
 
     def test_compliance_score_empty(self) -> None:
         stats = ct.ComplianceStats()
@@ -306,10 +383,12 @@ class TestComplianceTracker:
         assert event.session_id == "sess-001"
         assert event.file_path == "/tmp/test.py"
 
-    def test_log_event_writes_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_log_event_writes_file(
+        self, frozen_ts: float, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         monkeypatch.setenv("COMPLIANCE_LOG_DIR", str(tmp_path))
         event = ct.ComplianceEvent(
-            timestamp=time.time(),
+            timestamp=frozen_ts,
             session_id="test",
             tool_name="Read",
             hook_event="PostToolUse",
@@ -326,8 +405,21 @@ class TestComplianceTracker:
 # --- File structure tests ---
 
 
+@pytest.fixture(scope="module")
+def hook_line_counts() -> dict[str, int]:
+    """Newline counts for every hook file, read once per module."""
+    return {
+        hook_file: (_hooks_dir / hook_file).read_bytes().count(b"\n")
+        for hook_file in ("cila_router.py", "knowledge_manager.py", "compliance_tracker.py")
+    }
+
+
+@pytest.mark.parallel_safe
 class TestFileStructure:
-    """Test all required files exist with minimum line counts."""
+    """Test all required files exist with minimum line counts.
+
+    Read-only checks against the source tree; safe to run under ``pytest -n auto``.
+    """
 
     @pytest.mark.parametrize(
         "hook_file",
@@ -337,37 +429,16 @@ class TestFileStructure:
         path = base_dir / "claude_code_kazuba/data/modules" / "hooks-routing" / "hooks" / hook_file
         assert path.is_file()
 
-    def test_cila_router_min_lines(self, base_dir: Path) -> None:
-        path = (
-            base_dir
-            / "claude_code_kazuba/data/modules"
-            / "hooks-routing"
-            / "hooks"
-            / "cila_router.py"
-        )
-        lines = path.read_text().count("\n")
+    def test_cila_router_min_lines(self, hook_line_counts: dict[str, int]) -> None:
+        lines = hook_line_counts["cila_router.py"]
         assert lines >= 80, f"cila_router.py must have 80+ lines, has {lines}"
 
-    def test_knowledge_manager_min_lines(self, base_dir: Path) -> None:
-        path = (
-            base_dir
-            / "claude_code_kazuba/data/modules"
-            / "hooks-routing"
-            / "hooks"
-            / "knowledge_manager.py"
-        )
-        lines = path.read_text().count("\n")
+    def test_knowledge_manager_min_lines(self, hook_line_counts: dict[str, int]) -> None:
+        lines = hook_line_counts["knowledge_manager.py"]
         assert lines >= 60, f"knowledge_manager.py must have 60+ lines, has {lines}"
 
-    def test_compliance_tracker_min_lines(self, base_dir: Path) -> None:
-        path = (
-            base_dir
-            / "claude_code_kazuba/data/modules"
-            / "hooks-routing"
-            / "hooks"
-            / "compliance_tracker.py"
-        )
-        lines = path.read_text().count("\n")
+    def test_compliance_tracker_min_lines(self, hook_line_counts: dict[str, int]) -> None:
+        lines = hook_line_counts["compliance_tracker.py"]
         assert lines >= 50, f"compliance_tracker.py must have 50+ lines, has {lines}"
 
     @pytest.mark.parametrize(
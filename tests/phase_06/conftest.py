@@ -0,0 +1,68 @@
+"""Conftest for Phase 6 tests.
+
+Resolves the content-module manifests declared by the test modules
+(``ALL_MODULES``, ``ALL_SKILLS``, ``ALL_AGENTS``, ``ALL_COMMANDS``) into
+concrete file paths once, at collection time, so each parametrized case
+receives a prebuilt ``Path`` instead of rebuilding it in the test body.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.conftest import MODULES_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from tests.phase_06.test_content_modules import ContentSpec
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize manifest-driven tests with pre-resolved file paths."""
+    # Looked up via sys.modules: Metafunc.module is untyped in pytest
+    module = sys.modules.get(metafunc.function.__module__)
+    if module is None:
+        return
+    fixtures = metafunc.fixturenames
+
+    module_names: Sequence[str] = getattr(module, "ALL_MODULES", ())
+    if "module_md" in fixtures and module_names:
+        metafunc.parametrize(
+            "module_name,module_md",
+            [(name, MODULES_DIR / name / "MODULE.md") for name in module_names],
+            ids=list(module_names),
+        )
+
+    skills: Sequence[ContentSpec] = getattr(module, "ALL_SKILLS", ())
+    if "skill_path" in fixtures and skills:
+        metafunc.parametrize(
+            "spec,skill_path",
+            [
+                (spec, MODULES_DIR / spec.module / "skills" / spec.name / "SKILL.md")
+                for spec in skills
+            ],
+            ids=[spec.name for spec in skills],
+        )
+
+    agents: Sequence[ContentSpec] = getattr(module, "ALL_AGENTS", ())
+    if "agent_path" in fixtures and agents:
+        metafunc.parametrize(
+            "spec,agent_path",
+            [(spec, MODULES_DIR / spec.module / "agents" / f"{spec.name}.md") for spec in agents],
+            ids=[spec.name for spec in agents],
+        )
+
+    commands: Sequence[ContentSpec] = getattr(module, "ALL_COMMANDS", ())
+    if "command_path" in fixtures and commands:
+        metafunc.parametrize(
+            "spec,command_path",
+            [
+                (spec, MODULES_DIR / spec.module / "commands" / f"{spec.name}.md")
+                for spec in commands
+            ],
+            ids=[spec.name for spec in commands],
+        )
@@ -6,49 +6,39 @@ Tests cover:
 - Agent definition file existence and structure
 - Command definition file existence and structure
 - Minimum content length enforcement (no stubs)
+
+Every test here is read-only and depends only on session-scoped fixtures,
+so the module is marked ``parallel_safe`` and can be distributed freely
+with ``pytest -n auto`` (pytest-xdist).
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
-import yaml
-
-
-@pytest.fixture
-def project_root() -> Path:
-    return Path(__file__).resolve().parent.parent.parent
 
+from tests.conftest import extract_frontmatter, line_count
 
-@pytest.fixture
-def modules_dir(project_root: Path) -> Path:
-    return project_root / "claude_code_kazuba/data/modules"
+pytestmark = pytest.mark.parallel_safe
 
 
-def _extract_frontmatter(path: Path) -> dict | None:
-    """Extract YAML frontmatter from a markdown file (--- delimited)."""
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        return None
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None
-    try:
-        return yaml.safe_load(parts[1])
-    except yaml.YAMLError:
-        return None
+class ContentSpec(NamedTuple):
+    """A manifest entry: owning module, item name, and minimum line count."""
 
-
-def _line_count(path: Path) -> int:
-    """Return the number of lines in a file."""
-    return len(path.read_text(encoding="utf-8").splitlines())
+    module: str
+    name: str
+    min_lines: int
 
 
 # ---------------------------------------------------------------------------
 # MODULE.md Tests
 # ---------------------------------------------------------------------------
 
+_MODULE_REQUIRED_FIELDS = frozenset({"name", "description", "version"})
+_AGENT_REQUIRED_FIELDS = frozenset({"name", "description", "tools"})
+
 ALL_MODULES = [
     "skills-meta",
     "skills-dev",
@@ -66,34 +56,32 @@ ALL_MODULES = [
 class TestModuleMdFiles:
     """Validate MODULE.md exists in every module with proper frontmatter."""
 
-    @pytest.mark.parametrize("module_name", ALL_MODULES)
-    def test_module_md_exists(self, modules_dir: Path, module_name: str) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        assert module_md.is_file(), f"MODULE.md missing for module {module_name}"
+    def test_module_md_exists(
+        self, file_sizes: dict[str, int], module_name: str, module_md: Path
+    ) -> None:
+        assert str(module_md) in file_sizes, f"MODULE.md missing for module {module_name}"
 
-    @pytest.mark.parametrize("module_name", ALL_MODULES)
-    def test_module_md_has_yaml_frontmatter(self, modules_dir: Path, module_name: str) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        fm = _extract_frontmatter(module_md)
+    def test_module_md_has_yaml_frontmatter(self, module_name: str, module_md: Path) -> None:
+        fm = extract_frontmatter(module_md)
         assert fm is not None, f"MODULE.md for {module_name} has no YAML frontmatter"
 
-    @pytest.mark.parametrize("module_name", ALL_MODULES)
     def test_module_md_frontmatter_has_required_fields(
-        self, modules_dir: Path, module_name: str
+        self, module_name: str, module_md: Path
     ) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        fm = _extract_frontmatter(module_md)
+        fm = extract_frontmatter(module_md)
         assert fm is not None
-        for field in ("name", "description", "version"):
-            assert field in fm, f"MODULE.md for {module_name} missing required field '{field}'"
+        missing = _MODULE_REQUIRED_FIELDS - fm.keys()
+        assert not missing, (
+            f"MODULE.md for {module_name} missing required fields {sorted(missing)}"
+        )
         assert fm["name"] == module_name, (
             f"MODULE.md name mismatch: expected '{module_name}', got '{fm['name']}'"
         )
 
-    @pytest.mark.parametrize("module_name", ALL_MODULES)
-    def test_module_md_minimum_lines(self, modules_dir: Path, module_name: str) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        lines = _line_count(module_md)
+    def test_module_md_minimum_lines(
+        self, file_sizes: dict[str, int], module_name: str, module_md: Path
+    ) -> None:
+        lines = line_count(module_md) if str(module_md) in file_sizes else 0
         assert lines >= 20, f"MODULE.md for {module_name} has {lines} lines, expected >= 20"
 
 
@@ -101,183 +89,134 @@ class TestModuleMdFiles:
 # SKILL.md Tests
 # ---------------------------------------------------------------------------
 
-ALL_SKILLS = [
-    ("skills-meta", "hook-master", 200),
-    ("skills-meta", "skill-master", 200),
-    ("skills-meta", "skill-writer", 80),
-    ("skills-dev", "verification-loop", 100),
-    ("skills-dev", "supreme-problem-solver", 100),
-    ("skills-dev", "eval-harness", 80),
-    ("skills-planning", "plan-amplifier", 150),
-    ("skills-planning", "plan-execution", 120),
-    ("skills-planning", "code-first-planner", 100),
-    ("skills-research", "academic-research-writer", 100),
-    ("skills-research", "literature-review", 80),
-]
+ALL_SKILLS = (
+    ContentSpec("skills-meta", "hook-master", 200),
+    ContentSpec("skills-meta", "skill-master", 200),
+    ContentSpec("skills-meta", "skill-writer", 80),
+    ContentSpec("skills-dev", "verification-loop", 100),
+    ContentSpec("skills-dev", "supreme-problem-solver", 100),
+    ContentSpec("skills-dev", "eval-harness", 80),
+    ContentSpec("skills-planning", "plan-amplifier", 150),
+    ContentSpec("skills-planning", "plan-execution", 120),
+    ContentSpec("skills-planning", "code-first-planner", 100),
+    ContentSpec("skills-research", "academic-research-writer", 100),
+    ContentSpec("skills-research", "literature-review", 80),
+)
 
 
 class TestSkillFiles:
-    """Validate all SKILL.md files exist with proper content."""
+    """Validate all SKILL.md files exist with proper content.
+
+    Cases are parametrized from ``ALL_SKILLS`` by ``conftest.pytest_generate_tests``.
+    """
 
-    @pytest.mark.parametrize(
-        "module,skill,_min_lines",
-        ALL_SKILLS,
-        ids=[s[1] for s in ALL_SKILLS],
-    )
     def test_skill_file_exists(
-        self, modules_dir: Path, module: str, skill: str, _min_lines: int
-    ) -> None:
-        path = modules_dir / module / "skills" / skill / "SKILL.md"
-        assert path.is_file(), f"SKILL.md missing: {module}/skills/{skill}/SKILL.md"
-
-    @pytest.mark.parametrize(
-        "module,skill,_min_lines",
-        ALL_SKILLS,
-        ids=[s[1] for s in ALL_SKILLS],
-    )
-    def test_skill_has_yaml_frontmatter(
-        self, modules_dir: Path, module: str, skill: str, _min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, skill_path: Path
     ) -> None:
-        path = modules_dir / module / "skills" / skill / "SKILL.md"
-        fm = _extract_frontmatter(path)
-        assert fm is not None, f"{skill}/SKILL.md has no YAML frontmatter"
-        assert "name" in fm, f"{skill}/SKILL.md frontmatter missing 'name'"
-        assert "description" in fm, f"{skill}/SKILL.md frontmatter missing 'description'"
-        assert fm["name"] == skill, (
-            f"{skill}/SKILL.md name mismatch: expected '{skill}', got '{fm['name']}'"
+        assert str(skill_path) in file_sizes, f"SKILL.md missing: {skill_path}"
+
+    def test_skill_has_yaml_frontmatter(self, spec: ContentSpec, skill_path: Path) -> None:
+        fm = extract_frontmatter(skill_path)
+        assert fm is not None, f"{spec.name}/SKILL.md has no YAML frontmatter"
+        assert "name" in fm, f"{spec.name}/SKILL.md frontmatter missing 'name'"
+        assert "description" in fm, f"{spec.name}/SKILL.md frontmatter missing 'description'"
+        assert fm["name"] == spec.name, (
+            f"{spec.name}/SKILL.md name mismatch: expected '{spec.name}', got '{fm['name']}'"
         )
 
-    @pytest.mark.parametrize(
-        "module,skill,min_lines",
-        ALL_SKILLS,
-        ids=[s[1] for s in ALL_SKILLS],
-    )
     def test_skill_minimum_lines(
-        self, modules_dir: Path, module: str, skill: str, min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, skill_path: Path
     ) -> None:
-        path = modules_dir / module / "skills" / skill / "SKILL.md"
-        lines = _line_count(path)
-        assert lines >= min_lines, f"{skill}/SKILL.md has {lines} lines, expected >= {min_lines}"
+        lines = line_count(skill_path) if str(skill_path) in file_sizes else 0
+        assert lines >= spec.min_lines, (
+            f"{spec.name}/SKILL.md has {lines} lines, expected >= {spec.min_lines}"
+        )
 
-    def test_total_skill_count(self, modules_dir: Path) -> None:
+    def test_total_skill_count(self, skill_index: dict[str, tuple[Path, ...]]) -> None:
         """Ensure we have at least 10 distinct skills across all modules."""
-        skills = sorted(modules_dir.rglob("SKILL.md"))
-        assert len(skills) >= 10, f"Expected >= 10 SKILL.md files, found {len(skills)}"
+        count = sum(len(paths) for paths in skill_index.values())
+        assert count >= 10, f"Expected >= 10 SKILL.md files, found {count}"
 
 
 # ---------------------------------------------------------------------------
 # Agent Definition Tests
 # ---------------------------------------------------------------------------
 
-ALL_AGENTS = [
-    ("agents-dev", "code-reviewer", 60),
-    ("agents-dev", "security-auditor", 60),
-    ("agents-dev", "meta-orchestrator", 80),
-]
+ALL_AGENTS = (
+    ContentSpec("agents-dev", "code-reviewer", 60),
+    ContentSpec("agents-dev", "security-auditor", 60),
+    ContentSpec("agents-dev", "meta-orchestrator", 80),
+)
 
 
 class TestAgentFiles:
-    """Validate all agent definition files exist with proper structure."""
+    """Validate all agent definition files exist with proper structure.
+
+    Cases are parametrized from ``ALL_AGENTS`` by ``conftest.pytest_generate_tests``.
+    """
 
-    @pytest.mark.parametrize(
-        "module,agent,_min_lines",
-        ALL_AGENTS,
-        ids=[a[1] for a in ALL_AGENTS],
-    )
     def test_agent_file_exists(
-        self, modules_dir: Path, module: str, agent: str, _min_lines: int
-    ) -> None:
-        path = modules_dir / module / "agents" / f"{agent}.md"
-        assert path.is_file(), f"Agent file missing: {module}/agents/{agent}.md"
-
-    @pytest.mark.parametrize(
-        "module,agent,_min_lines",
-        ALL_AGENTS,
-        ids=[a[1] for a in ALL_AGENTS],
-    )
-    def test_agent_has_frontmatter_with_tools(
-        self, modules_dir: Path, module: str, agent: str, _min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, agent_path: Path
     ) -> None:
-        path = modules_dir / module / "agents" / f"{agent}.md"
-        fm = _extract_frontmatter(path)
-        assert fm is not None, f"{agent}.md has no YAML frontmatter"
-        assert "name" in fm, f"{agent}.md frontmatter missing 'name'"
-        assert "description" in fm, f"{agent}.md frontmatter missing 'description'"
-        assert "tools" in fm, f"{agent}.md frontmatter missing 'tools'"
-        assert isinstance(fm["tools"], list), f"{agent}.md 'tools' must be a list"
-        assert len(fm["tools"]) >= 1, f"{agent}.md must list at least 1 tool"
-
-    @pytest.mark.parametrize(
-        "module,agent,min_lines",
-        ALL_AGENTS,
-        ids=[a[1] for a in ALL_AGENTS],
-    )
+        assert str(agent_path) in file_sizes, f"Agent file missing: {agent_path}"
+
+    def test_agent_has_frontmatter_with_tools(self, spec: ContentSpec, agent_path: Path) -> None:
+        fm = extract_frontmatter(agent_path)
+        assert fm is not None, f"{spec.name}.md has no YAML frontmatter"
+        missing = _AGENT_REQUIRED_FIELDS - fm.keys()
+        assert not missing, f"{spec.name}.md frontmatter missing {sorted(missing)}"
+        assert isinstance(fm["tools"], list), f"{spec.name}.md 'tools' must be a list"
+        assert len(fm["tools"]) >= 1, f"{spec.name}.md must list at least 1 tool"
+
     def test_agent_minimum_lines(
-        self, modules_dir: Path, module: str, agent: str, min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, agent_path: Path
     ) -> None:
-        path = modules_dir / module / "agents" / f"{agent}.md"
-        lines = _line_count(path)
-        assert lines >= min_lines, f"{agent}.md has {lines} lines, expected >= {min_lines}"
+        lines = line_count(agent_path) if str(agent_path) in file_sizes else 0
+        assert lines >= spec.min_lines, (
+            f"{spec.name}.md has {lines} lines, expected >= {spec.min_lines}"
+        )
 
 
 # ---------------------------------------------------------------------------
 # Command Definition Tests
 # ---------------------------------------------------------------------------
 
-ALL_COMMANDS = [
-    ("commands-dev", "debug-RCA", 60),
-    ("commands-dev", "smart-commit", 40),
-    ("commands-dev", "orchestrate", 60),
-    ("commands-dev", "verify", 40),
-    ("commands-prp", "prp-base-create", 60),
-    ("commands-prp", "prp-base-execute", 60),
-]
+ALL_COMMANDS = (
+    ContentSpec("commands-dev", "debug-RCA", 60),
+    ContentSpec("commands-dev", "smart-commit", 40),
+    ContentSpec("commands-dev", "orchestrate", 60),
+    ContentSpec("commands-dev", "verify", 40),
+    ContentSpec("commands-prp", "prp-base-create", 60),
+    ContentSpec("commands-prp", "prp-base-execute", 60),
+)
 
 
 class TestCommandFiles:
-    """Validate all command definition files exist with proper structure."""
+    """Validate all command definition files exist with proper structure.
+
+    Cases are parametrized from ``ALL_COMMANDS`` by ``conftest.pytest_generate_tests``.
+    """
 
-    @pytest.mark.parametrize(
-        "module,command,_min_lines",
-        ALL_COMMANDS,
-        ids=[c[1] for c in ALL_COMMANDS],
-    )
     def test_command_file_exists(
-        self, modules_dir: Path, module: str, command: str, _min_lines: int
-    ) -> None:
-        path = modules_dir / module / "commands" / f"{command}.md"
-        assert path.is_file(), f"Command file missing: {module}/commands/{command}.md"
-
-    @pytest.mark.parametrize(
-        "module,command,_min_lines",
-        ALL_COMMANDS,
-        ids=[c[1] for c in ALL_COMMANDS],
-    )
-    def test_command_has_frontmatter(
-        self, modules_dir: Path, module: str, command: str, _min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, command_path: Path
     ) -> None:
-        path = modules_dir / module / "commands" / f"{command}.md"
-        fm = _extract_frontmatter(path)
-        assert fm is not None, f"{command}.md has no YAML frontmatter"
-        assert "name" in fm, f"{command}.md frontmatter missing 'name'"
-        assert "description" in fm, f"{command}.md frontmatter missing 'description'"
-
-    @pytest.mark.parametrize(
-        "module,command,min_lines",
-        ALL_COMMANDS,
-        ids=[c[1] for c in ALL_COMMANDS],
-    )
+        assert str(command_path) in file_sizes, f"Command file missing: {command_path}"
+
+    def test_command_has_frontmatter(self, spec: ContentSpec, command_path: Path) -> None:
+        fm = extract_frontmatter(command_path)
+        assert fm is not None, f"{spec.name}.md has no YAML frontmatter"
+        assert "name" in fm, f"{spec.name}.md frontmatter missing 'name'"
+        assert "description" in fm, f"{spec.name}.md frontmatter missing 'description'"
+
     def test_command_minimum_lines(
-        self, modules_dir: Path, module: str, command: str, min_lines: int
+        self, file_sizes: dict[str, int], spec: ContentSpec, command_path: Path
     ) -> None:
-        path = modules_dir / module / "commands" / f"{command}.md"
-        lines = _line_count(path)
-        assert lines >= min_lines, f"{command}.md has {lines} lines, expected >= {min_lines}"
+        lines = line_count(command_path) if str(command_path) in file_sizes else 0
+        assert lines >= spec.min_lines, (
+            f"{spec.name}.md has {lines} lines, expected >= {spec.min_lines}"
+        )
 
-    def test_total_command_count(self, modules_dir: Path) -> None:
+    def test_total_command_count(self, command_index: dict[str, tuple[Path, ...]]) -> None:
         """Ensure at least 6 command files exist across all modules."""
-        commands: list[Path] = []
-        for commands_dir in modules_dir.rglob("commands/"):
-            if commands_dir.is_dir():
-                commands.extend(p for p in commands_dir.glob("*.md") if p.name != "MODULE.md")
-        assert len(commands) >= 6, f"Expected >= 6 command files, found {len(commands)}"
+        count = sum(len(paths) for paths in command_index.values())
+        assert count >= 6, f"Expected >= 6 command files, found {count}"
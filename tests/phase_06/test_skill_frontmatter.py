@@ -3,40 +3,18 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
-import yaml
 
-
-@pytest.fixture
-def project_root() -> Path:
-    return Path(__file__).resolve().parent.parent.parent
-
-
-@pytest.fixture
-def modules_dir(project_root: Path) -> Path:
-    return project_root / "claude_code_kazuba/data/modules"
-
-
-def _extract_frontmatter(path: Path) -> dict | None:
-    """Extract YAML frontmatter from a markdown file (--- delimited)."""
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        return None
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None
-    try:
-        return yaml.safe_load(parts[1])
-    except yaml.YAMLError:
-        return None
+from tests.conftest import ModuleManifest, extract_frontmatter, scandir_recursive
 
 
 class TestSkillFrontmatter:
     """Validate all SKILL.md files have valid YAML frontmatter with required fields."""
 
     def _find_skill_files(self, modules_dir: Path) -> list[Path]:
-        return sorted(modules_dir.rglob("SKILL.md"))
+        return sorted(Path(e.path) for e in scandir_recursive(modules_dir, name="SKILL.md"))
 
     def test_skill_files_exist(self, modules_dir: Path) -> None:
         skills = self._find_skill_files(modules_dir)
@@ -58,13 +36,15 @@ class TestSkillFrontmatter:
             "literature-review",
         ],
     )
-    def test_skill_has_valid_frontmatter(self, modules_dir: Path, skill_name: str) -> None:
-        matches = list(modules_dir.rglob(f"{skill_name}/SKILL.md"))
+    def test_skill_has_valid_frontmatter(
+        self, skill_index: dict[str, tuple[Path, ...]], skill_name: str
+    ) -> None:
+        matches = skill_index.get(skill_name, ())
         assert len(matches) == 1, (
             f"Expected exactly 1 SKILL.md for {skill_name}, found {len(matches)}"
         )
 
-        fm = _extract_frontmatter(matches[0])
+        fm = extract_frontmatter(matches[0])
         assert fm is not None, f"{skill_name}/SKILL.md has no valid YAML frontmatter"
         assert "name" in fm, f"{skill_name}/SKILL.md frontmatter missing 'name'"
         assert "description" in fm, f"{skill_name}/SKILL.md frontmatter missing 'description'"
@@ -72,10 +52,13 @@ class TestSkillFrontmatter:
             f"{skill_name}/SKILL.md name mismatch: expected '{skill_name}', got '{fm['name']}'"
         )
 
-    def test_all_skills_have_frontmatter(self, modules_dir: Path) -> None:
-        skills = self._find_skill_files(modules_dir)
-        for skill_path in skills:
-            fm = _extract_frontmatter(skill_path)
+    def test_all_skills_have_frontmatter(
+        self,
+        skill_index: dict[str, tuple[Path, ...]],
+        frontmatter_index: dict[Path, dict[str, Any] | None],
+    ) -> None:
+        for skill_path in (p for paths in skill_index.values() for p in paths):
+            fm = frontmatter_index[skill_path]
             assert fm is not None, f"{skill_path} has no valid YAML frontmatter"
             assert "name" in fm, f"{skill_path} frontmatter missing 'name'"
             assert "description" in fm, f"{skill_path} frontmatter missing 'description'"
@@ -85,12 +68,9 @@ class TestAgentFrontmatter:
     """Validate all agent .md files have valid YAML frontmatter."""
 
     def _find_agent_files(self, modules_dir: Path) -> list[Path]:
-        agents_dirs = list(modules_dir.rglob("agents/"))
-        agent_files: list[Path] = []
-        for agents_dir in agents_dirs:
-            if agents_dir.is_dir():
-                agent_files.extend(sorted(agents_dir.glob("*.md")))
-        return agent_files
+        # Agents live at <module>/agents/<name>.md; a bounded glob avoids
+        # walking every unrelated subtree.
+        return sorted(modules_dir.glob("*/agents/*.md"))
 
     def test_agent_files_exist(self, modules_dir: Path) -> None:
         agents = self._find_agent_files(modules_dir)
@@ -100,11 +80,13 @@ class TestAgentFrontmatter:
         "agent_name",
         ["code-reviewer", "security-auditor", "meta-orchestrator"],
     )
-    def test_agent_has_valid_frontmatter(self, modules_dir: Path, agent_name: str) -> None:
-        matches = list(modules_dir.rglob(f"agents/{agent_name}.md"))
+    def test_agent_has_valid_frontmatter(
+        self, agent_index: dict[str, tuple[Path, ...]], agent_name: str
+    ) -> None:
+        matches = agent_index.get(agent_name, ())
         assert len(matches) == 1, f"Expected exactly 1 {agent_name}.md, found {len(matches)}"
 
-        fm = _extract_frontmatter(matches[0])
+        fm = extract_frontmatter(matches[0])
         assert fm is not None, f"{agent_name}.md has no valid YAML frontmatter"
         assert "name" in fm, f"{agent_name}.md frontmatter missing 'name'"
         assert "description" in fm, f"{agent_name}.md frontmatter missing 'description'"
@@ -112,10 +94,13 @@ class TestAgentFrontmatter:
         assert isinstance(fm["tools"], list), f"{agent_name}.md 'tools' must be a list"
         assert len(fm["tools"]) >= 1, f"{agent_name}.md must have at least 1 tool"
 
-    def test_all_agents_have_frontmatter(self, modules_dir: Path) -> None:
-        agents = self._find_agent_files(modules_dir)
-        for agent_path in agents:
-            fm = _extract_frontmatter(agent_path)
+    def test_all_agents_have_frontmatter(
+        self,
+        agent_index: dict[str, tuple[Path, ...]],
+        frontmatter_index: dict[Path, dict[str, Any] | None],
+    ) -> None:
+        for agent_path in (p for paths in agent_index.values() for p in paths):
+            fm = frontmatter_index[agent_path]
             assert fm is not None, f"{agent_path} has no valid YAML frontmatter"
             assert "name" in fm, f"{agent_path} frontmatter missing 'name'"
             assert "description" in fm, f"{agent_path} frontmatter missing 'description'"
@@ -139,18 +124,15 @@ class TestModuleManifests:
     ]
 
     @pytest.mark.parametrize("module_name", REQUIRED_MODULES)
-    def test_module_md_exists_and_not_empty(self, modules_dir: Path, module_name: str) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        assert module_md.is_file(), f"MODULE.md missing for module {module_name}"
-        content = module_md.read_text(encoding="utf-8")
-        assert len(content.strip()) > 50, (
-            f"MODULE.md for {module_name} is too short ({len(content.strip())} chars)"
+    def test_module_md_valid(
+        self, module_manifest_index: dict[str, ModuleManifest], module_name: str
+    ) -> None:
+        manifest = module_manifest_index.get(module_name)
+        assert manifest is not None, f"MODULE.md missing for module {module_name}"
+        assert manifest.size > 50, (
+            f"MODULE.md for {module_name} is too short ({manifest.size} bytes)"
         )
-
-    @pytest.mark.parametrize("module_name", REQUIRED_MODULES)
-    def test_module_md_has_frontmatter(self, modules_dir: Path, module_name: str) -> None:
-        module_md = modules_dir / module_name / "MODULE.md"
-        fm = _extract_frontmatter(module_md)
+        fm = manifest.frontmatter
         assert fm is not None, f"MODULE.md for {module_name} has no valid YAML frontmatter"
         assert "name" in fm, f"MODULE.md for {module_name} missing 'name'"
         assert "description" in fm, f"MODULE.md for {module_name} missing 'description'"
@@ -169,11 +151,33 @@ class TestCommandFiles:
     ]
 
     @pytest.mark.parametrize("command_name", EXPECTED_COMMANDS)
-    def test_command_has_valid_frontmatter(self, modules_dir: Path, command_name: str) -> None:
-        matches = list(modules_dir.rglob(f"commands/{command_name}.md"))
+    def test_command_has_valid_frontmatter(
+        self, command_index: dict[str, tuple[Path, ...]], command_name: str
+    ) -> None:
+        matches = command_index.get(command_name, ())
         assert len(matches) == 1, f"Expected exactly 1 {command_name}.md, found {len(matches)}"
 
-        fm = _extract_frontmatter(matches[0])
+        fm = extract_frontmatter(matches[0])
         assert fm is not None, f"{command_name}.md has no valid YAML frontmatter"
         assert "name" in fm, f"{command_name}.md frontmatter missing 'name'"
         assert "description" in fm, f"{command_name}.md frontmatter missing 'description'"
+
+
+class TestExtractFrontmatter:
+    """Validate the shared frontmatter extractor on line-ending edge cases."""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+    def test_parses_frontmatter(self, tmp_path: Path, newline: str) -> None:
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(newline.join(["---", "name: demo", "---", "# Body", ""]).encode())
+        assert extract_frontmatter(path) == {"name": "demo"}
+
+    def test_missing_closing_delimiter(self, tmp_path: Path) -> None:
+        path = tmp_path / "SKILL.md"
+        path.write_text("---\nname: demo\n# Body\n", encoding="utf-8")
+        assert extract_frontmatter(path) is None
+
+    def test_no_frontmatter(self, tmp_path: Path) -> None:
+        path = tmp_path / "SKILL.md"
+        path.write_text("# Body\n---\n", encoding="utf-8")
+        assert extract_frontmatter(path) is None
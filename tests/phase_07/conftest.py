@@ -0,0 +1,53 @@
+"""Conftest for Phase 7 tests.
+
+Provides ``hypervisor_configs``: the three config-hypervisor YAML files,
+looked up once per module in the session ``yaml_index`` rather than
+parsed once per test or per parametrized section, and the
+``hypervisor_config`` accessor that tests read them through.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import yaml
+
+from tests.conftest import MODULES_DIR, load_yaml_file
+
+_HYPERVISOR_CONFIG_DIR = MODULES_DIR / "config-hypervisor" / "config"
+_HYPERVISOR_YAMLS = ("hypervisor.yaml", "agent_triggers.yaml", "event_mesh.yaml")
+
+
+def hypervisor_config(configs: dict[str, object], filename: str) -> Any:
+    """Return the parsed document for ``filename`` from ``hypervisor_configs``.
+
+    Fails the calling test with the recorded error when the file was
+    missing or not valid YAML, rather than handing the exception back.
+    """
+    value = configs[filename]
+    if isinstance(value, (OSError, yaml.YAMLError)):
+        pytest.fail(f"config-hypervisor/config/{filename}: {value}")
+    return value
+
+
+@pytest.fixture(scope="module")
+def hypervisor_configs(yaml_index: dict[str, Any]) -> dict[str, object]:
+    """Map each config-hypervisor YAML filename to its parsed document.
+
+    Documents come from the session ``yaml_index``. A file that is missing
+    or fails to parse (and so is absent from the index) maps to the raised
+    exception; read entries through ``hypervisor_config`` so the affected
+    tests fail with that error instead of the fixture erroring for all.
+    """
+    configs: dict[str, object] = {}
+    for filename in _HYPERVISOR_YAMLS:
+        key = f"config-hypervisor/config/{filename}"
+        if key in yaml_index:
+            configs[filename] = yaml_index[key]
+            continue
+        try:
+            configs[filename] = load_yaml_file(_HYPERVISOR_CONFIG_DIR / filename)
+        except (OSError, yaml.YAMLError) as e:
+            configs[filename] = e
+    return configs
@@ -3,40 +3,37 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
 
+from tests.conftest import MODULES_DIR, load_yaml, load_yaml_file, scandir_recursive
+from tests.phase_07.conftest import hypervisor_config
 
-@pytest.fixture
-def project_root() -> Path:
-    return Path(__file__).resolve().parent.parent.parent
-
-
-@pytest.fixture
-def modules_dir(project_root: Path) -> Path:
-    return project_root / "claude_code_kazuba/data/modules"
+# Discovered at collection time so every file is its own test case, which
+# pytest-xdist can distribute across workers.
+_YAML_FILES = sorted(
+    Path(e.path) for e in scandir_recursive(MODULES_DIR, suffix=(".yaml", ".yml"))
+)
 
 
 class TestYamlValidity:
     """Validate all .yaml files are valid YAML."""
 
-    def _find_yaml_files(self, modules_dir: Path) -> list[Path]:
-        return sorted(modules_dir.rglob("*.yaml")) + sorted(modules_dir.rglob("*.yml"))
-
-    def test_yaml_files_exist(self, modules_dir: Path) -> None:
-        yamls = self._find_yaml_files(modules_dir)
-        assert len(yamls) >= 5, f"Expected >= 5 YAML files, found {len(yamls)}"
+    def test_yaml_files_exist(self) -> None:
+        assert len(_YAML_FILES) >= 5, f"Expected >= 5 YAML files, found {len(_YAML_FILES)}"
 
-    def test_all_yaml_files_are_valid(self, modules_dir: Path) -> None:
-        yamls = self._find_yaml_files(modules_dir)
-        for yaml_path in yamls:
-            content = yaml_path.read_text(encoding="utf-8")
-            try:
-                data = yaml.safe_load(content)
-                assert data is not None, f"{yaml_path} parsed as empty/null"
-            except yaml.YAMLError as e:
-                pytest.fail(f"{yaml_path} is not valid YAML: {e}")
+    @pytest.mark.parallel_safe
+    @pytest.mark.parametrize(
+        "yaml_path", _YAML_FILES, ids=[p.relative_to(MODULES_DIR).as_posix() for p in _YAML_FILES]
+    )
+    def test_yaml_file_is_valid(self, yaml_path: Path) -> None:
+        try:
+            data = load_yaml_file(yaml_path)
+        except yaml.YAMLError as e:
+            pytest.fail(f"{yaml_path} is not valid YAML: {e}")
+        assert data is not None, f"{yaml_path} parsed as empty/null"
 
 
 class TestHypervisorConfig:
@@ -55,22 +52,21 @@ class TestHypervisorConfig:
         assert path.is_file(), "hypervisor.yaml missing"
 
     @pytest.mark.parametrize("section", REQUIRED_SECTIONS)
-    def test_hypervisor_has_section(self, modules_dir: Path, section: str) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "hypervisor.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_hypervisor_has_section(
+        self, hypervisor_configs: dict[str, object], section: str
+    ) -> None:
+        data = hypervisor_config(hypervisor_configs, "hypervisor.yaml")
         assert section in data, f"hypervisor.yaml missing section '{section}'"
 
-    def test_thinking_has_levels(self, modules_dir: Path) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "hypervisor.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_thinking_has_levels(self, hypervisor_configs: dict[str, object]) -> None:
+        data = hypervisor_config(hypervisor_configs, "hypervisor.yaml")
         levels = data["thinking"]["levels"]
         assert len(levels) == 4, f"Expected 4 thinking levels, got {len(levels)}"
-        level_names = {lvl["name"] for lvl in levels}
-        assert level_names == {"low", "medium", "high", "critical"}
+        level_names = sorted(lvl["name"] for lvl in levels)
+        assert level_names == ["critical", "high", "low", "medium"], level_names
 
-    def test_circuit_breakers_have_thresholds(self, modules_dir: Path) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "hypervisor.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_circuit_breakers_have_thresholds(self, hypervisor_configs: dict[str, object]) -> None:
+        data = hypervisor_config(hypervisor_configs, "hypervisor.yaml")
         breakers = data["circuit_breakers"]
         assert len(breakers) >= 5, f"Expected >= 5 circuit breakers, got {len(breakers)}"
 
@@ -82,15 +78,13 @@ class TestAgentTriggers:
         path = modules_dir / "config-hypervisor" / "config" / "agent_triggers.yaml"
         assert path.is_file(), "agent_triggers.yaml missing"
 
-    def test_has_at_least_5_triggers(self, modules_dir: Path) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "agent_triggers.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_has_at_least_5_triggers(self, hypervisor_configs: dict[str, object]) -> None:
+        data = hypervisor_config(hypervisor_configs, "agent_triggers.yaml")
         triggers = data.get("triggers", [])
         assert len(triggers) >= 5, f"Expected >= 5 triggers, got {len(triggers)}"
 
-    def test_triggers_have_required_fields(self, modules_dir: Path) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "agent_triggers.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_triggers_have_required_fields(self, hypervisor_configs: dict[str, object]) -> None:
+        data = hypervisor_config(hypervisor_configs, "agent_triggers.yaml")
         required_fields = {"name", "condition", "agent_type", "priority"}
         for trigger in data["triggers"]:
             missing = required_fields - set(trigger.keys())
@@ -104,9 +98,8 @@ class TestEventMesh:
         path = modules_dir / "config-hypervisor" / "config" / "event_mesh.yaml"
         assert path.is_file(), "event_mesh.yaml missing"
 
-    def test_has_categories(self, modules_dir: Path) -> None:
-        path = modules_dir / "config-hypervisor" / "config" / "event_mesh.yaml"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_has_categories(self, hypervisor_configs: dict[str, object]) -> None:
+        data = hypervisor_config(hypervisor_configs, "event_mesh.yaml")
         assert "categories" in data, "event_mesh.yaml missing 'categories'"
         assert len(data["categories"]) >= 7, (
             f"Expected >= 7 categories, got {len(data['categories'])}"
@@ -130,11 +123,11 @@ class TestContextFiles:
     @pytest.mark.parametrize("ctx_name", EXPECTED_CONTEXTS)
     def test_context_has_frontmatter(self, modules_dir: Path, ctx_name: str) -> None:
         path = modules_dir / "contexts" / "contexts" / f"{ctx_name}.md"
-        text = path.read_text(encoding="utf-8")
-        assert text.startswith("---"), f"Context {ctx_name}.md missing frontmatter"
-        parts = text.split("---", 2)
-        assert len(parts) >= 3, f"Context {ctx_name}.md frontmatter not properly delimited"
-        fm = yaml.safe_load(parts[1])
+        data = path.read_bytes()
+        assert data.startswith(b"---"), f"Context {ctx_name}.md missing frontmatter"
+        end = data.find(b"\n---", 3)
+        assert end >= 0, f"Context {ctx_name}.md frontmatter not properly delimited"
+        fm = load_yaml(data[3:end])
         assert fm is not None, f"Context {ctx_name}.md frontmatter is empty"
         assert "name" in fm, f"Context {ctx_name}.md frontmatter missing 'name'"
 
@@ -142,24 +135,21 @@ class TestContextFiles:
 class TestTeamOrchestrator:
     """Validate team-orchestrator config and templates."""
 
-    def test_agents_yaml_exists(self, modules_dir: Path) -> None:
-        path = modules_dir / "team-orchestrator" / "config" / "agents.yaml"
-        assert path.is_file(), "team-orchestrator agents.yaml missing"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_agents_yaml_exists(self, yaml_index: dict[str, Any]) -> None:
+        data = yaml_index.get("team-orchestrator/config/agents.yaml")
+        assert data is not None, "team-orchestrator agents.yaml missing or invalid"
         assert "agents" in data
         assert len(data["agents"]) >= 3
 
-    def test_routing_rules_yaml_exists(self, modules_dir: Path) -> None:
-        path = modules_dir / "team-orchestrator" / "config" / "routing_rules.yaml"
-        assert path.is_file(), "team-orchestrator routing_rules.yaml missing"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_routing_rules_yaml_exists(self, yaml_index: dict[str, Any]) -> None:
+        data = yaml_index.get("team-orchestrator/config/routing_rules.yaml")
+        assert data is not None, "team-orchestrator routing_rules.yaml missing or invalid"
         assert "rules" in data
         assert len(data["rules"]) >= 7
 
-    def test_sla_yaml_exists(self, modules_dir: Path) -> None:
-        path = modules_dir / "team-orchestrator" / "config" / "sla.yaml"
-        assert path.is_file(), "team-orchestrator sla.yaml missing"
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    def test_sla_yaml_exists(self, yaml_index: dict[str, Any]) -> None:
+        data = yaml_index.get("team-orchestrator/config/sla.yaml")
+        assert data is not None, "team-orchestrator sla.yaml missing or invalid"
         assert "latency_targets" in data
         assert "rate_limits" in data
 
@@ -188,9 +178,8 @@ class TestSharedPatterns:
     def test_shared_file_is_valid_yaml(self, modules_dir: Path, filename: str) -> None:
         path = modules_dir / "commands-prp" / "commands" / "shared" / filename
         assert path.is_file(), f"Shared file {filename} missing"
-        content = path.read_text(encoding="utf-8")
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml_file(path)
             assert data is not None, f"{filename} parsed as empty/null"
         except yaml.YAMLError as e:
             pytest.fail(f"{filename} is not valid YAML: {e}")
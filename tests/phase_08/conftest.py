@@ -0,0 +1,59 @@
+"""Conftest for Phase 8 tests.
+
+Provides ``claude_tree``: a per-test copy of a complete, valid ``.claude/``
+installation. The canonical tree is written once per module and each copy
+hardlinks its files, so a test pays one ``link`` per file instead of an
+``open`` + ``write``. Tests that need a broken tree replace the one file
+they change with ``replace_file`` (never write through a hardlink, which
+would edit the shared template).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_TEMPLATE_FILES = {
+    "settings.json": json.dumps(
+        {
+            "$schema": "https://json.schemastore.org/claude-code-settings.json",
+            "permissions": {},
+            "hooks": {"PreToolUse": [{"type": "command", "command": "python hooks/test.py"}]},
+        }
+    ),
+    "hooks/test.py": "# hook",
+    "skills/test-skill/SKILL.md": "---\nname: test\n---\n# Test\n",
+    "CLAUDE.md": "# Project\n\nThis is a valid CLAUDE.md file with enough content.\n",
+}
+
+
+def replace_file(path: Path, content: str) -> None:
+    """Give ``path`` new content without touching any file it is linked to."""
+    path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture(scope="module")
+def claude_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Materialize the canonical valid ``.claude/`` tree once per module."""
+    root = tmp_path_factory.mktemp("claude_template")
+    for rel, content in _TEMPLATE_FILES.items():
+        path = root / ".claude" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+@pytest.fixture
+def claude_tree(claude_template: Path, tmp_path: Path) -> Path:
+    """Return a project dir whose ``.claude/`` hardlinks the canonical tree."""
+    shutil.copytree(claude_template / ".claude", tmp_path / ".claude", copy_function=os.link)
+    return tmp_path
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import TYPE_CHECKING
 
 from claude_code_kazuba.installer.detect_stack import detect_stack
@@ -124,3 +125,41 @@ class TestDetectFramework:
         (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
         result = detect_stack(tmp_path)
         assert "framework" not in result
+
+
+class TestManifestCache:
+    """Manifest reads are memoized but invalidated by edits."""
+
+    def test_edited_manifest_is_reread(self, tmp_path: Path) -> None:
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nrequires-python = ">=3.11"\n')
+        assert detect_stack(tmp_path)["version"] == ">=3.11"
+
+        pyproject.write_text('[project]\nrequires-python = ">=3.12"\n')
+        st = pyproject.stat()
+        os.utime(pyproject, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert detect_stack(tmp_path)["version"] == ">=3.12"
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        assert detect_stack(tmp_path / "nope") == {"language": "unknown"}
+
+    def test_large_manifest_framework_past_head(self, tmp_path: Path) -> None:
+        padding = "# filler\n" * 4000  # well past the scanned head
+        (tmp_path / "pyproject.toml").write_text(
+            f'[project]\nrequires-python = ">=3.12"\n{padding}dependencies = ["django"]\n'
+        )
+        result = detect_stack(tmp_path)
+        assert result["version"] == ">=3.12"
+        assert result["framework"] == "django"
+
+    def test_large_manifest_keeps_framework_priority(self, tmp_path: Path) -> None:
+        padding = "# filler\n" * 4000
+        (tmp_path / "pyproject.toml").write_text(
+            f'[project]\ndependencies = ["flask"]\n{padding}# django\n'
+        )
+        assert detect_stack(tmp_path)["framework"] == "django"
+
+    def test_directory_named_like_manifest_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "pyproject.toml").mkdir()
+        (tmp_path / "package.json").write_text(json.dumps({"name": "web"}))
+        assert detect_stack(tmp_path)["language"] == "javascript"
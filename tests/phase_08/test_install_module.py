@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import TYPE_CHECKING
 
 import pytest
 
 from claude_code_kazuba.installer.install_module import install_module
+from claude_code_kazuba.performance import ParallelExecutor
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -97,6 +99,27 @@ class TestInstallHooksModule:
         settings = json.loads((target_project / ".claude" / "settings.json").read_text())
         assert "hooks" in settings
 
+    def test_concurrent_merges_keep_every_module(
+        self, source_dir: Path, target_project: Path
+    ) -> None:
+        modules = ["hooks-essential", "hooks-quality", "hooks-routing"]
+        jobs = [
+            functools.partial(install_module, name, source_dir, target_project, {})
+            for name in modules
+        ]
+        ParallelExecutor(max_workers=len(jobs)).run(jobs)
+
+        claude_dir = target_project / ".claude"
+        settings = json.loads((claude_dir / "settings.json").read_text())
+        commands = {hook["command"] for hooks in settings["hooks"].values() for hook in hooks}
+        for name in modules:
+            overlay = json.loads(
+                (source_dir / "modules" / name / "settings.hooks.json").read_text()
+            )
+            for hooks in overlay["hooks"].values():
+                assert {hook["command"] for hook in hooks} <= commands, name
+        assert not list(claude_dir.glob("settings.json.tmp-*"))
+
     def test_install_hooks_quality(self, source_dir: Path, target_project: Path) -> None:
         result = install_module("hooks-quality", source_dir, target_project, {})
         hooks_dir = target_project / ".claude" / "hooks"
@@ -134,6 +157,21 @@ class TestInstallModuleErrors:
             assert not f.endswith(".pyc")
             assert "__pycache__" not in f
 
+    def test_bytecode_pruned_from_copy(self, tmp_path: Path, target_project: Path) -> None:
+        hooks = tmp_path / "src" / "modules" / "demo" / "hooks"
+        (hooks / "__pycache__").mkdir(parents=True)
+        (hooks / "__pycache__" / "gate.cpython-312.pyc").write_bytes(b"\0")
+        (hooks / "gate.py").write_text("pass\n")
+        (hooks / "stale.pyc").write_bytes(b"\0")
+        (hooks / "lib").mkdir()
+        (hooks / "lib" / "util.py").write_text("pass\n")
+
+        result = install_module("demo", tmp_path / "src", target_project, {})
+
+        dest = target_project / ".claude" / "hooks"
+        assert sorted(result["copied"]) == [str(dest / "gate.py"), str(dest / "lib" / "util.py")]
+        assert not (dest / "__pycache__").exists()
+
 
 class TestInstallOtherModules:
     """Test other module types."""
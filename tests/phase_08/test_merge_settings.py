@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from claude_code_kazuba.installer import merge_settings as merge_settings_module
 from claude_code_kazuba.installer.merge_settings import merge_settings, merge_settings_file
 
 if TYPE_CHECKING:
@@ -75,6 +76,21 @@ class TestMergeHooks:
         result = merge_settings(base, overlay)
         assert len(result["hooks"]["PreToolUse"]) == 1
 
+    def test_same_command_different_matcher_kept(self) -> None:
+        base: dict[str, Any] = {
+            "hooks": {"PreToolUse": [{"type": "command", "command": "gate.py", "matcher": "Bash"}]}
+        }
+        overlay: dict[str, Any] = {
+            "hooks": {
+                "PreToolUse": [
+                    {"matcher": "Bash", "command": "gate.py", "type": "command"},
+                    {"type": "command", "command": "gate.py", "matcher": "Write"},
+                ]
+            }
+        }
+        result = merge_settings(base, overlay)
+        assert [h["matcher"] for h in result["hooks"]["PreToolUse"]] == ["Bash", "Write"]
+
     def test_preserve_hook_order(self) -> None:
         base: dict[str, Any] = {
             "hooks": {
@@ -158,6 +174,28 @@ class TestMergeComplete:
         assert base == base_copy
         assert overlay == overlay_copy
 
+    def test_no_mutation_of_nested_inputs(self) -> None:
+        base: dict[str, Any] = {
+            "permissions": {"allow": ["Read"], "deny": ["Bash(rm:*)"]},
+            "hooks": {"PreToolUse": [{"matcher": "Bash", "hooks": [{"command": "a"}]}]},
+            "env": {"A": "1"},
+        }
+        overlay: dict[str, Any] = {
+            "permissions": {"allow": ["Write"]},
+            "hooks": {
+                "PreToolUse": [{"matcher": "Edit", "hooks": [{"command": "b"}]}],
+                "Stop": [{"hooks": [{"command": "c"}]}],
+            },
+            "env": {"B": "2"},
+        }
+        base_copy = json.loads(json.dumps(base))
+        overlay_copy = json.loads(json.dumps(overlay))
+        result = merge_settings(base, overlay)
+        assert base == base_copy
+        assert overlay == overlay_copy
+        assert list(result["env"]) == ["A", "B"]
+        assert len(result["hooks"]["PreToolUse"]) == 2
+
     def test_extra_top_level_keys(self) -> None:
         base: dict[str, Any] = {"custom": "value"}
         overlay: dict[str, Any] = {"extra": "new"}
@@ -188,6 +226,45 @@ class TestMergeSettingsFile:
         result = merge_settings_file(base_file, overlay_file)
         assert result["env"]["KEY"] == "val"
 
+    def test_merge_files_stdlib_fallback(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(merge_settings_module, "_orjson", None)
+        base_file = tmp_path / "base.json"
+        overlay_file = tmp_path / "overlay.json"
+        base_file.write_text(json.dumps({"env": {"A": "é"}}), encoding="utf-8")
+        overlay_file.write_text(json.dumps({"env": {"B": "2"}}), encoding="utf-8")
+
+        result = merge_settings_file(base_file, overlay_file)
+        assert result["env"] == {"A": "é", "B": "2"}
+
+    def test_merge_files_accepts_what_stdlib_accepts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class _StrictParser:
+            JSONDecodeError = json.JSONDecodeError
+
+            @staticmethod
+            def loads(data: bytes) -> Any:
+                raise json.JSONDecodeError("unsupported literal", data.decode(), 0)
+
+        # Stands in for orjson rejecting NaN and >64-bit integers
+        monkeypatch.setattr(merge_settings_module, "_orjson", _StrictParser)
+        base_file = tmp_path / "base.json"
+        overlay_file = tmp_path / "overlay.json"
+        base_file.write_text('{"env": {"A": NaN}, "big": 123456789012345678901234567890}')
+        overlay_file.write_text('{"env": {"B": "2"}}')
+
+        result = merge_settings_file(base_file, overlay_file)
+        assert result["big"] == 123456789012345678901234567890
+        assert set(result["env"]) == {"A", "B"}
+
+    def test_invalid_json_raises_decode_error(self, tmp_path: Path) -> None:
+        overlay_file = tmp_path / "overlay.json"
+        overlay_file.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            merge_settings_file(tmp_path / "base.json", overlay_file)
+
     def test_overlay_file_missing(self, tmp_path: Path) -> None:
         overlay_file = tmp_path / "missing.json"
         with pytest.raises(FileNotFoundError):
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+import sys
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from claude_code_kazuba.installer import resolve_deps
 from claude_code_kazuba.installer.resolve_deps import (
-    _parse_yaml_frontmatter,
+    _parse_frontmatter_bytes,
     resolve_dependencies,
 )
 
@@ -15,34 +18,34 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-class TestParseYamlFrontmatter:
+class TestParseFrontmatterBytes:
     """YAML frontmatter parser for MODULE.md files."""
 
     def test_basic_frontmatter(self) -> None:
-        text = '---\nname: core\nversion: "1.0.0"\ndependencies: []\n---\n# Core\n'
-        result = _parse_yaml_frontmatter(text)
+        data = b'---\nname: core\nversion: "1.0.0"\ndependencies: []\n---\n# Core\n'
+        result = _parse_frontmatter_bytes(data)
         assert result["name"] == "core"
         assert result["version"] == "1.0.0"
         assert result["dependencies"] == []
 
     def test_multiline_dependencies(self) -> None:
-        text = "---\nname: hooks\ndependencies:\n  - core\n  - utils\n---\n"
-        result = _parse_yaml_frontmatter(text)
+        data = b"---\nname: hooks\ndependencies:\n  - core\n  - utils\n---\n"
+        result = _parse_frontmatter_bytes(data)
         assert result["dependencies"] == ["core", "utils"]
 
     def test_no_frontmatter(self) -> None:
-        text = "# No frontmatter here\n"
-        result = _parse_yaml_frontmatter(text)
+        data = b"# No frontmatter here\n"
+        result = _parse_frontmatter_bytes(data)
         assert result == {}
 
     def test_empty_dependencies(self) -> None:
-        text = "---\nname: test\ndependencies: []\n---\n"
-        result = _parse_yaml_frontmatter(text)
+        data = b"---\nname: test\ndependencies: []\n---\n"
+        result = _parse_frontmatter_bytes(data)
         assert result["dependencies"] == []
 
     def test_inline_dependencies(self) -> None:
-        text = '---\nname: test\ndependencies: [core, "utils"]\n---\n'
-        result = _parse_yaml_frontmatter(text)
+        data = b'---\nname: test\ndependencies: [core, "utils"]\n---\n'
+        result = _parse_frontmatter_bytes(data)
         assert "core" in result["dependencies"]
         assert "utils" in result["dependencies"]
 
@@ -68,6 +71,24 @@ class TestResolveDependencies:
         result = resolve_dependencies(["core"], tmp_path / "modules", core_dir=tmp_path / "core")
         assert result == ["core"]
 
+    def test_repeated_single_module(self, tmp_path: Path) -> None:
+        self._make_module(tmp_path, "core", [])
+        result = resolve_dependencies(
+            ["core", "core"], tmp_path / "modules", core_dir=tmp_path / "core"
+        )
+        assert result == ["core"]
+
+    def test_crlf_module_md(self, tmp_path: Path) -> None:
+        (tmp_path / "core").mkdir()
+        (tmp_path / "core" / "MODULE.md").write_bytes(b"---\r\nname: core\r\n---\r\n")
+        hooks_dir = tmp_path / "modules" / "hooks"
+        hooks_dir.mkdir(parents=True)
+        (hooks_dir / "MODULE.md").write_bytes(
+            b"---\r\nname: hooks\r\ndependencies:\r\n  - core\r\n---\r\n"
+        )
+        result = resolve_dependencies(["hooks"], tmp_path / "modules", core_dir=tmp_path / "core")
+        assert result == ["core", "hooks"]
+
     def test_simple_chain(self, tmp_path: Path) -> None:
         self._make_module(tmp_path, "core", [])
         self._make_module(tmp_path, "hooks", ["core"])
@@ -114,6 +135,90 @@ class TestResolveDependencies:
         # core should appear only once
         assert result.count("core") == 1
 
+    def test_diamond_parses_each_module_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._make_module(tmp_path, "core", [])
+        self._make_module(tmp_path, "a", ["core"])
+        self._make_module(tmp_path, "b", ["core"])
+        self._make_module(tmp_path, "top", ["a", "b"])
+        parsed: list[str] = []
+
+        def _counting_parse(data: bytes) -> dict[str, Any]:
+            info = _parse_frontmatter_bytes(data)
+            parsed.append(info["name"])
+            return info
+
+        monkeypatch.setattr(resolve_deps, "_parse_frontmatter_bytes", _counting_parse)
+        resolve_dependencies(["top"], tmp_path / "modules", core_dir=tmp_path / "core")
+        assert sorted(parsed) == ["a", "b", "core", "top"]
+
+    def test_repeat_call_served_from_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._make_module(tmp_path, "core", [])
+        self._make_module(tmp_path, "hooks", ["core"])
+        first = resolve_dependencies(["hooks"], tmp_path / "modules", core_dir=tmp_path / "core")
+
+        def _fail_parse(data: bytes) -> dict[str, Any]:
+            raise AssertionError("MODULE.md re-parsed on an unchanged tree")
+
+        monkeypatch.setattr(resolve_deps, "_parse_frontmatter_bytes", _fail_parse)
+        second = resolve_dependencies(["hooks"], tmp_path / "modules", core_dir=tmp_path / "core")
+        assert second == first == ["core", "hooks"]
+        second.append("mutated")
+        assert resolve_dependencies(
+            ["hooks"], tmp_path / "modules", core_dir=tmp_path / "core"
+        ) == ["core", "hooks"]
+
+    def test_edited_dependency_invalidates_cache(self, tmp_path: Path) -> None:
+        self._make_module(tmp_path, "core", [])
+        self._make_module(tmp_path, "utils", [])
+        self._make_module(tmp_path, "hooks", ["core"])
+        modules_dir = tmp_path / "modules"
+        assert resolve_dependencies(["hooks"], modules_dir, core_dir=tmp_path / "core") == [
+            "core",
+            "hooks",
+        ]
+        # Editing a nested MODULE.md leaves modules_dir's own mtime untouched
+        self._make_module(tmp_path, "hooks", ["utils"])
+        result = resolve_dependencies(["hooks"], modules_dir, core_dir=tmp_path / "core")
+        assert result == ["utils", "hooks"]
+
+    def test_order_independent_of_request_order(self, tmp_path: Path) -> None:
+        self._make_module(tmp_path, "core", [])
+        self._make_module(tmp_path, "base", ["core"])
+        self._make_module(tmp_path, "zeta", ["base"])
+        self._make_module(tmp_path, "alpha", ["base"])
+        self._make_module(tmp_path, "mid", ["core"])
+        names = ["zeta", "mid", "alpha"]
+        results = {
+            tuple(resolve_dependencies(list(p), tmp_path / "modules", core_dir=tmp_path / "core"))
+            for p in itertools.permutations(names)
+        }
+        assert results == {("core", "base", "alpha", "mid", "zeta")}
+
+    def test_real_modules_order_independent(self, base_dir: Path) -> None:
+        data_dir = base_dir / "claude_code_kazuba" / "data"
+        modules_dir = data_dir / "modules"
+        core_dir = data_dir / "core"
+        names = ["hooks-quality", "hooks-routing", "hooks-essential"]
+        results = {
+            tuple(resolve_dependencies(list(p), modules_dir, core_dir=core_dir))
+            for p in itertools.permutations(names)
+        }
+        assert len(results) == 1
+
+    def test_deep_chain_exceeds_recursion_limit(self, tmp_path: Path) -> None:
+        depth = sys.getrecursionlimit() + 100
+        self._make_module(tmp_path, "m0", [])
+        for i in range(1, depth):
+            self._make_module(tmp_path, f"m{i}", [f"m{i - 1}"])
+        result = resolve_dependencies(
+            [f"m{depth - 1}"], tmp_path / "modules", core_dir=tmp_path / "core"
+        )
+        assert result == [f"m{i}" for i in range(depth)]
+
     def test_default_core_dir(self, tmp_path: Path) -> None:
         """When core_dir is not specified, it defaults to modules_dir parent / core."""
         self._make_module(tmp_path, "core", [])
@@ -3,60 +3,101 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import TYPE_CHECKING
 
+import pytest
+
 from claude_code_kazuba.installer.validate_installation import validate_installation
+from tests.phase_08.conftest import replace_file
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+# validate_installation results keyed by the fingerprint of the tree they were computed on
+_validate_results: dict[tuple[tuple[str, int, int, int], ...], dict[str, bool]] = {}
+
+
+def _fingerprint(root: Path) -> tuple[tuple[str, int, int, int], ...]:
+    """Identify a tree by its entries' relative paths and, for files, inode/mtime/size.
+
+    Walked with ``os.scandir``: entry types and inodes come from the directory
+    listing itself, so only files need a ``stat`` (for mtime and size).
+    """
+    prefix = len(os.fspath(root)) + 1
+    out: list[tuple[str, int, int, int]] = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                rel = entry.path[prefix:]
+                if entry.is_dir(follow_symlinks=False):
+                    out.append((rel, -1, -1, -1))
+                    stack.append(entry.path)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    out.append((rel, entry.inode(), st.st_mtime_ns, st.st_size))
+    out.sort()
+    return tuple(out)
+
+
+def _cached_validate(target_dir: Path) -> dict[str, bool]:
+    """Run ``validate_installation``, memoized on ``_fingerprint`` of the tree.
+
+    Copies of ``claude_tree`` hardlink the same inodes and so share one
+    result, while any file a test replaces or removes changes the
+    fingerprint and forces a fresh run.
+    """
+    key = _fingerprint(target_dir)
+    if key not in _validate_results:
+        _validate_results[key] = validate_installation(target_dir)
+    return dict(_validate_results[key])
+
 
 class TestValidateDirectoryStructure:
     """Verify .claude/ directory checks."""
 
     def test_missing_claude_dir(self, tmp_path: Path) -> None:
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["directory_structure"] is False
 
     def test_claude_dir_exists(self, tmp_path: Path) -> None:
         (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["directory_structure"] is True
 
 
 class TestValidateSettingsJson:
     """Verify settings.json validation."""
 
-    def test_valid_settings(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        settings = {
-            "$schema": "https://json.schemastore.org/claude-code-settings.json",
-            "permissions": {},
-            "hooks": {},
-        }
-        (claude_dir / "settings.json").write_text(json.dumps(settings))
-        result = validate_installation(tmp_path)
-        assert result["settings_json"] is True
-
-    def test_missing_settings(self, tmp_path: Path) -> None:
-        (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
-        assert result["settings_json"] is False
-
-    def test_invalid_json(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "settings.json").write_text("not json {{{")
-        result = validate_installation(tmp_path)
-        assert result["settings_json"] is False
-
-    def test_missing_schema(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "settings.json").write_text(json.dumps({"permissions": {}}))
-        result = validate_installation(tmp_path)
-        assert result["settings_json"] is False
+    @pytest.mark.parametrize(
+        ("settings", "expected"),
+        [
+            pytest.param(
+                json.dumps(
+                    {
+                        "$schema": "https://json.schemastore.org/claude-code-settings.json",
+                        "permissions": {},
+                        "hooks": {},
+                    }
+                ),
+                True,
+                id="valid_settings",
+            ),
+            pytest.param(None, False, id="missing_settings"),
+            pytest.param("not json {{{", False, id="invalid_json"),
+            pytest.param(json.dumps({"permissions": {}}), False, id="missing_schema"),
+        ],
+    )
+    def test_settings_json(self, claude_tree: Path, settings: str | None, expected: bool) -> None:
+        """``settings`` replaces the tree's settings.json; None removes it."""
+        settings_path = claude_tree / ".claude" / "settings.json"
+        if settings is None:
+            settings_path.unlink()
+        else:
+            replace_file(settings_path, settings)
+        result = _cached_validate(claude_tree)
+        assert result["settings_json"] is expected
 
 
 class TestValidateHookScripts:
@@ -64,37 +105,16 @@ class TestValidateHookScripts:
 
     def test_no_hooks_dir_passes(self, tmp_path: Path) -> None:
         (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["hook_scripts"] is True
 
-    def test_hooks_present(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        hooks_dir = claude_dir / "hooks"
-        hooks_dir.mkdir()
-        (hooks_dir / "test.py").write_text("# hook")
-
-        settings = {
-            "$schema": "https://json.schemastore.org/claude-code-settings.json",
-            "hooks": {"PreToolUse": [{"type": "command", "command": "python hooks/test.py"}]},
-        }
-        (claude_dir / "settings.json").write_text(json.dumps(settings))
-
-        result = validate_installation(tmp_path)
+    def test_hooks_present(self, claude_tree: Path) -> None:
+        result = _cached_validate(claude_tree)
         assert result["hook_scripts"] is True
 
-    def test_missing_hook_script(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "hooks").mkdir()
-
-        settings = {
-            "$schema": "https://json.schemastore.org/claude-code-settings.json",
-            "hooks": {"PreToolUse": [{"type": "command", "command": "python hooks/missing.py"}]},
-        }
-        (claude_dir / "settings.json").write_text(json.dumps(settings))
-
-        result = validate_installation(tmp_path)
+    def test_missing_hook_script(self, claude_tree: Path) -> None:
+        (claude_tree / ".claude" / "hooks" / "test.py").unlink()
+        result = _cached_validate(claude_tree)
         assert result["hook_scripts"] is False
 
 
@@ -103,76 +123,53 @@ class TestValidateSkillFiles:
 
     def test_no_skills_dir_passes(self, tmp_path: Path) -> None:
         (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["skill_files"] is True
 
-    def test_valid_skill_md(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        skills_dir = claude_dir / "skills" / "test-skill"
-        skills_dir.mkdir(parents=True)
-        (skills_dir / "SKILL.md").write_text("---\nname: test\n---\n# Test\n")
-
-        result = validate_installation(tmp_path)
+    def test_valid_skill_md(self, claude_tree: Path) -> None:
+        result = _cached_validate(claude_tree)
         assert result["skill_files"] is True
 
-    def test_invalid_skill_md(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        skills_dir = claude_dir / "skills" / "bad-skill"
-        skills_dir.mkdir(parents=True)
-        (skills_dir / "SKILL.md").write_text("# No frontmatter here\n")
-
-        result = validate_installation(tmp_path)
+    def test_invalid_skill_md(self, claude_tree: Path) -> None:
+        bad_skill = claude_tree / ".claude" / "skills" / "bad-skill" / "SKILL.md"
+        replace_file(bad_skill, "# No frontmatter here\n")
+        result = _cached_validate(claude_tree)
         assert result["skill_files"] is False
 
 
 class TestValidateClaudeMd:
     """Verify CLAUDE.md checks."""
 
-    def test_claude_md_present(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "CLAUDE.md").write_text(
-            "# Project\n\nThis is a valid CLAUDE.md file with enough content.\n"
-        )
-        result = validate_installation(tmp_path)
+    def test_claude_md_present(self, claude_tree: Path) -> None:
+        result = _cached_validate(claude_tree)
         assert result["claude_md"] is True
 
     def test_claude_md_missing(self, tmp_path: Path) -> None:
         (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["claude_md"] is False
 
-    def test_claude_md_too_short(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "CLAUDE.md").write_text("# X\n")
-        result = validate_installation(tmp_path)
+    def test_claude_md_too_short(self, claude_tree: Path) -> None:
+        replace_file(claude_tree / ".claude" / "CLAUDE.md", "# X\n")
+        result = _cached_validate(claude_tree)
         assert result["claude_md"] is False
 
 
 class TestValidateOverall:
     """Overall validation result."""
 
-    def test_all_passed_true(self, tmp_path: Path) -> None:
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        (claude_dir / "settings.json").write_text(
-            json.dumps({"$schema": "https://example.com/s.json"})
-        )
-        (claude_dir / "CLAUDE.md").write_text(
-            "# Project\n\nFull CLAUDE.md content with enough text to pass the check.\n"
-        )
-        result = validate_installation(tmp_path)
+    def test_all_passed_true(self, claude_tree: Path) -> None:
+        result = _cached_validate(claude_tree)
         assert result["all_passed"] is True
 
     def test_all_passed_false_when_any_fails(self, tmp_path: Path) -> None:
         # No .claude/ dir
-        result = validate_installation(tmp_path)
+        result = _cached_validate(tmp_path)
         assert result["all_passed"] is False
 
     def test_messages_present(self, tmp_path: Path) -> None:
         (tmp_path / ".claude").mkdir()
-        result = validate_installation(tmp_path)
-        assert "_messages" in result
-        assert isinstance(result["_messages"], list)
-        assert len(result["_messages"]) > 0
+        result = _cached_validate(tmp_path)
+        messages = result.get("_messages")
+        assert isinstance(messages, list), f"_messages missing or not a list: {messages!r}"
+        assert messages
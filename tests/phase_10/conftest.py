@@ -0,0 +1,57 @@
+"""Conftest for Phase 10 tests.
+
+Provides ``ci_yaml``: the CI workflow read and parsed once per session, so
+the pipeline tests share one YAML parse instead of one each; and ``readme``:
+README.md read once per session, with its lowercased form precomputed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pytest
+
+from tests.conftest import line_count, load_yaml_file
+
+# Project root (tests/phase_10 → tests → project root); the test module
+# imports these so the paths are defined in one place.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+CI_PATH = BASE_DIR / ".github" / "workflows" / "ci.yml"
+README_PATH = BASE_DIR / "README.md"
+
+
+class CIWorkflow(NamedTuple):
+    """The CI workflow file as a line count and parsed document."""
+
+    line_count: int
+    parsed: Any
+
+
+@pytest.fixture(scope="session")
+def ci_yaml() -> CIWorkflow:
+    """Read and parse ``.github/workflows/ci.yml`` once per session.
+
+    Both helpers work on the raw bytes (newline count, LibYAML decoding in
+    C), so the file is never decoded into a Python string. If the file is
+    absent every dependent test is skipped; ``test_ci_yml_exists`` is the
+    one that reports it.
+    """
+    try:
+        return CIWorkflow(line_count(CI_PATH), load_yaml_file(CI_PATH))
+    except FileNotFoundError:
+        pytest.skip(f"{CI_PATH} not present")
+
+
+class Readme(NamedTuple):
+    """README.md content, as written and lowercased."""
+
+    text: str
+    lower: str
+
+
+@pytest.fixture(scope="session")
+def readme() -> Readme:
+    """Read ``README.md`` once per session."""
+    text = README_PATH.read_text()
+    return Readme(text, text.lower())
@@ -6,12 +6,24 @@ line counts, and reference actual project artifacts.
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+import re
+from typing import TYPE_CHECKING
 
 import pytest
-import yaml  # noqa: TC002
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+from tests.conftest import line_count
+from tests.phase_10.conftest import BASE_DIR, CI_PATH, README_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from tests.phase_10.conftest import CIWorkflow, Readme
+
+MODULES_CATALOG_PATH = BASE_DIR / "docs" / "MODULES_CATALOG.md"
+ARCHITECTURE_PATH = BASE_DIR / "docs" / "ARCHITECTURE.md"
+HOOKS_REF_PATH = BASE_DIR / "docs" / "HOOKS_REFERENCE.md"
+PRESETS_DIR = BASE_DIR / "claude_code_kazuba" / "data" / "presets"
 
 
 # --- CI Pipeline ---
@@ -22,44 +34,32 @@ class TestCIPipeline:
 
     def test_ci_yml_exists(self) -> None:
         """CI workflow file must exist."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        assert ci_path.exists(), f"Missing: {ci_path}"
+        assert CI_PATH.exists(), f"Missing: {CI_PATH}"
 
-    def test_ci_yml_is_valid_yaml(self) -> None:
+    def test_ci_yml_is_valid_yaml(self, ci_yaml: CIWorkflow) -> None:
         """CI workflow must be valid YAML."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        content = ci_path.read_text()
-        parsed = yaml.safe_load(content)
-        assert isinstance(parsed, dict), "ci.yml must parse to a dict"
+        assert isinstance(ci_yaml.parsed, dict), "ci.yml must parse to a dict"
 
-    def test_ci_yml_min_lines(self) -> None:
+    def test_ci_yml_min_lines(self, ci_yaml: CIWorkflow) -> None:
         """CI workflow must have at least 50 lines."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        lines = ci_path.read_text().splitlines()
-        assert len(lines) >= 50, f"ci.yml has {len(lines)} lines, expected >= 50"
+        lines = ci_yaml.line_count
+        assert lines >= 50, f"ci.yml has {lines} lines, expected >= 50"
 
-    def test_ci_yml_has_lint_job(self) -> None:
+    def test_ci_yml_has_lint_job(self, ci_yaml: CIWorkflow) -> None:
         """CI must include a lint job."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        parsed = yaml.safe_load(ci_path.read_text())
-        assert "lint" in parsed.get("jobs", {}), "Missing 'lint' job"
+        assert "lint" in ci_yaml.parsed.get("jobs", {}), "Missing 'lint' job"
 
-    def test_ci_yml_has_test_job(self) -> None:
+    def test_ci_yml_has_test_job(self, ci_yaml: CIWorkflow) -> None:
         """CI must include a test job."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        parsed = yaml.safe_load(ci_path.read_text())
-        assert "test" in parsed.get("jobs", {}), "Missing 'test' job"
+        assert "test" in ci_yaml.parsed.get("jobs", {}), "Missing 'test' job"
 
-    def test_ci_yml_has_typecheck_job(self) -> None:
+    def test_ci_yml_has_typecheck_job(self, ci_yaml: CIWorkflow) -> None:
         """CI must include a typecheck job."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        parsed = yaml.safe_load(ci_path.read_text())
-        assert "typecheck" in parsed.get("jobs", {}), "Missing 'typecheck' job"
+        assert "typecheck" in ci_yaml.parsed.get("jobs", {}), "Missing 'typecheck' job"
 
-    def test_ci_triggers_on_push_and_pr(self) -> None:
+    def test_ci_triggers_on_push_and_pr(self, ci_yaml: CIWorkflow) -> None:
         """CI must trigger on push to main and pull requests."""
-        ci_path = BASE_DIR / ".github" / "workflows" / "ci.yml"
-        parsed = yaml.safe_load(ci_path.read_text())
+        parsed = ci_yaml.parsed
         on_config = parsed.get("on", parsed.get(True, {}))
         assert "push" in on_config, "Missing push trigger"
         assert "pull_request" in on_config, "Missing pull_request trigger"
@@ -77,26 +77,37 @@ DOC_FILES = {
 }
 
 
+@pytest.fixture(scope="session")
+def doc_line_counts() -> dict[str, int | None]:
+    """Map each documentation file to its line count (None if missing), read once."""
+    counts: dict[str, int | None] = {}
+    for doc_path in DOC_FILES:
+        try:
+            counts[doc_path] = line_count(BASE_DIR / doc_path)
+        except FileNotFoundError:
+            counts[doc_path] = None
+    return counts
+
+
 class TestDocumentation:
     """Tests for documentation files."""
 
     @pytest.mark.parametrize("doc_path", list(DOC_FILES.keys()))
-    def test_doc_file_exists(self, doc_path: str) -> None:
+    def test_doc_file_exists(self, doc_line_counts: dict[str, int | None], doc_path: str) -> None:
         """Each documentation file must exist."""
-        full_path = BASE_DIR / doc_path
-        assert full_path.exists(), f"Missing: {full_path}"
+        assert doc_line_counts[doc_path] is not None, f"Missing: {BASE_DIR / doc_path}"
 
     @pytest.mark.parametrize(
         ("doc_path", "min_lines"),
         list(DOC_FILES.items()),
     )
-    def test_doc_min_lines(self, doc_path: str, min_lines: int) -> None:
+    def test_doc_min_lines(
+        self, doc_line_counts: dict[str, int | None], doc_path: str, min_lines: int
+    ) -> None:
         """Each documentation file must meet minimum line count."""
-        full_path = BASE_DIR / doc_path
-        lines = full_path.read_text().splitlines()
-        assert len(lines) >= min_lines, (
-            f"{doc_path} has {len(lines)} lines, expected >= {min_lines}"
-        )
+        lines = doc_line_counts[doc_path]
+        assert lines is not None, f"Missing: {BASE_DIR / doc_path}"
+        assert lines >= min_lines, f"{doc_path} has {lines} lines, expected >= {min_lines}"
 
 
 # --- README ---
@@ -107,54 +118,43 @@ class TestReadme:
 
     def test_readme_exists(self) -> None:
         """README.md must exist at project root."""
-        readme = BASE_DIR / "README.md"
-        assert readme.exists(), f"Missing: {readme}"
+        assert README_PATH.exists(), f"Missing: {README_PATH}"
 
-    def test_readme_has_badges(self) -> None:
+    def test_readme_has_badges(self, readme: Readme) -> None:
         """README must include CI and license badges."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
+        content = readme.text
         assert "[![CI]" in content, "Missing CI badge"
         assert "[![License" in content or "License" in content, "Missing license badge"
 
-    def test_readme_has_quick_start(self) -> None:
+    def test_readme_has_quick_start(self, readme: Readme) -> None:
         """README must have a Quick Start section."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
-        assert "Quick Start" in content, "Missing Quick Start section"
+        assert "Quick Start" in readme.text, "Missing Quick Start section"
 
-    def test_readme_has_clone_instruction(self) -> None:
+    def test_readme_has_clone_instruction(self, readme: Readme) -> None:
         """README quick start must include git clone."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
-        assert "git clone" in content, "Missing git clone instruction"
+        assert "git clone" in readme.text, "Missing git clone instruction"
 
-    def test_readme_has_preset_mention(self) -> None:
+    def test_readme_has_preset_mention(self, readme: Readme) -> None:
         """README must mention presets."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
-        assert "preset" in content.lower(), "Missing preset mention"
+        assert "preset" in readme.lower, "Missing preset mention"
 
-    def test_readme_has_module_table(self) -> None:
+    def test_readme_has_module_table(self, readme: Readme) -> None:
         """README must include a module catalog or architecture section."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text().lower()
+        content = readme.lower
         assert "module" in content and ("catalog" in content or "arquitetura" in content), (
             "Missing module catalog/architecture section"
         )
 
-    def test_readme_has_contributing(self) -> None:
+    def test_readme_has_contributing(self, readme: Readme) -> None:
         """README must have a Contributing section."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
+        content = readme.text
         assert "Contributing" in content or "Contribuindo" in content, (
             "Missing Contributing/Contribuindo section"
         )
 
-    def test_readme_has_license(self) -> None:
+    def test_readme_has_license(self, readme: Readme) -> None:
         """README must mention the license."""
-        readme = BASE_DIR / "README.md"
-        content = readme.read_text()
+        content = readme.text
         assert "License" in content or "MIT" in content, "Missing license info"
 
 
@@ -180,60 +180,94 @@ ACTUAL_MODULE_NAMES = [
 ]
 
 
+KEY_MODULE_DIRS = ["hooks-essential", "hooks-quality", "skills-dev", "agents-dev"]
+
+HOOK_EVENTS = [
+    "PreToolUse",
+    "PostToolUse",
+    "UserPromptSubmit",
+    "Stop",
+    "PreCompact",
+    "SessionStart",
+    "SessionStop",
+    "SubagentToolUse",
+    "PostSubagentToolUse",
+    "PreAssistantTurn",
+    "PostAssistantTurn",
+    "PreApproval",
+    "PostApproval",
+    "PrePlanModeApproval",
+    "PostPlanModeApproval",
+    "PreNotification",
+    "PostNotification",
+    "Heartbeat",
+]
+
+
+def _alternation(names: Iterable[str]) -> re.Pattern[str]:
+    """Compile a literal alternation of ``names``, longest first."""
+    return re.compile("|".join(map(re.escape, sorted(names, key=len, reverse=True))))
+
+
+def _missing_names(pattern: re.Pattern[str], names: Iterable[str], text: str) -> list[str]:
+    """Return the ``names`` that do not occur in ``text``, sorted.
+
+    ``text`` is scanned once with ``pattern`` (an ``_alternation`` of the
+    names). Matches do not overlap, so a name the scan did not report (e.g.
+    ``Stop`` only occurring inside ``SessionStop``) gets a direct substring
+    check before it counts as missing.
+    """
+    found = {m.group() for m in pattern.finditer(text)}
+    return sorted(name for name in names if name not in found and name not in text)
+
+
+_MODULE_NAMES_RE = _alternation(ACTUAL_MODULE_NAMES)
+_KEY_MODULE_DIRS_RE = _alternation(KEY_MODULE_DIRS)
+_HOOK_EVENTS_RE = _alternation(HOOK_EVENTS)
+
+
+@pytest.fixture(scope="session")
+def docs_text() -> dict[str, str]:
+    """Read the cross-referenced docs once per session (README comes from ``readme``)."""
+    return {
+        "catalog": MODULES_CATALOG_PATH.read_text(),
+        "architecture": ARCHITECTURE_PATH.read_text(),
+        "hooks_ref": HOOKS_REF_PATH.read_text(),
+    }
+
+
 class TestCrossReferences:
     """Tests that docs reference actual module names."""
 
-    def test_catalog_references_all_modules(self) -> None:
+    def test_catalog_references_all_modules(self, docs_text: dict[str, str]) -> None:
         """MODULES_CATALOG.md must reference every module."""
-        catalog = (BASE_DIR / "docs" / "MODULES_CATALOG.md").read_text()
-        for module_name in ACTUAL_MODULE_NAMES:
-            assert module_name in catalog, (
-                f"MODULES_CATALOG.md missing reference to module: {module_name}"
-            )
+        catalog = docs_text["catalog"]
+        missing = _missing_names(_MODULE_NAMES_RE, ACTUAL_MODULE_NAMES, catalog)
+        assert not missing, f"MODULES_CATALOG.md missing reference to modules: {missing}"
 
-    def test_architecture_references_module_dirs(self) -> None:
+    def test_architecture_references_module_dirs(self, docs_text: dict[str, str]) -> None:
         """ARCHITECTURE.md must reference key module directories."""
-        arch = (BASE_DIR / "docs" / "ARCHITECTURE.md").read_text()
-        key_dirs = ["hooks-essential", "hooks-quality", "skills-dev", "agents-dev"]
-        for dir_name in key_dirs:
-            assert dir_name in arch, f"ARCHITECTURE.md missing reference to: {dir_name}"
+        arch = docs_text["architecture"]
+        missing = _missing_names(_KEY_MODULE_DIRS_RE, KEY_MODULE_DIRS, arch)
+        assert not missing, f"ARCHITECTURE.md missing reference to: {missing}"
 
-    def test_hooks_reference_mentions_all_events(self) -> None:
+    def test_hooks_reference_mentions_all_events(self, docs_text: dict[str, str]) -> None:
         """HOOKS_REFERENCE.md must document all 18 hook events."""
-        hooks_ref = (BASE_DIR / "docs" / "HOOKS_REFERENCE.md").read_text()
-        events = [
-            "PreToolUse",
-            "PostToolUse",
-            "UserPromptSubmit",
-            "Stop",
-            "PreCompact",
-            "SessionStart",
-            "SessionStop",
-            "SubagentToolUse",
-            "PostSubagentToolUse",
-            "PreAssistantTurn",
-            "PostAssistantTurn",
-            "PreApproval",
-            "PostApproval",
-            "PrePlanModeApproval",
-            "PostPlanModeApproval",
-            "PreNotification",
-            "PostNotification",
-            "Heartbeat",
-        ]
-        for event in events:
-            assert event in hooks_ref, f"HOOKS_REFERENCE.md missing event: {event}"
-
-    def test_docs_link_to_each_other(self) -> None:
+        hooks_ref = docs_text["hooks_ref"]
+        missing = _missing_names(_HOOK_EVENTS_RE, HOOK_EVENTS, hooks_ref)
+        assert not missing, f"HOOKS_REFERENCE.md missing events: {missing}"
+
+    def test_docs_link_to_each_other(self, readme: Readme) -> None:
         """README should link to documentation files."""
-        readme = (BASE_DIR / "README.md").read_text()
         for doc_name in ["ARCHITECTURE.md", "HOOKS_REFERENCE.md", "MODULES_CATALOG.md"]:
-            assert doc_name in readme, f"README missing link to {doc_name}"
+            assert doc_name in readme.text, f"README missing link to {doc_name}"
 
-    def test_readme_references_actual_presets(self) -> None:
+    def test_readme_references_actual_presets(self, readme: Readme) -> None:
         """README must reference the actual preset names."""
-        readme = (BASE_DIR / "README.md").read_text()
-        presets_dir = BASE_DIR / "claude_code_kazuba" / "data" / "presets"
-        for preset_file in presets_dir.glob("*.txt"):
-            preset_name = preset_file.stem
-            assert preset_name in readme, f"README missing reference to preset: {preset_name}"
+        with os.scandir(PRESETS_DIR) as it:
+            preset_names = {
+                entry.name.removesuffix(".txt") for entry in it if entry.name.endswith(".txt")
+            }
+        assert preset_names, f"No presets found in {PRESETS_DIR}"
+        missing = _missing_names(_alternation(preset_names), preset_names, readme.text)
+        assert not missing, f"README missing reference to presets: {', '.join(missing)}"
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import threading
-import time
+from typing import TYPE_CHECKING
 
 import pytest
 
+from claude_code_kazuba import circuit_breaker
 from claude_code_kazuba.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -15,6 +17,40 @@ from claude_code_kazuba.circuit_breaker import (
     CircuitBreakerState,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    _ConfigFactory = Callable[..., CircuitBreakerConfig]
+
+
+def _raise_boom() -> None:
+    msg = "boom"
+    raise ValueError(msg)
+
+
+@pytest.fixture(scope="module")
+def cb_config() -> _ConfigFactory:
+    """Return a config factory that validates each distinct set of arguments once.
+
+    Configs are frozen, so one instance per argument set is shared across
+    the module's tests instead of re-running pydantic validation each time.
+    """
+    return functools.cache(CircuitBreakerConfig)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace the breaker clock with a virtual one; advance it via ``clock[0] += dt``."""
+    clock = [0.0]
+    monkeypatch.setattr(circuit_breaker, "_now", lambda: clock[0])
+    return clock
+
+
+@pytest.fixture
+def cb(cb_config: _ConfigFactory) -> CircuitBreaker:
+    """Return a fresh breaker named ``test`` with the shared default config."""
+    return CircuitBreaker("test", cb_config())
+
 
 class TestCircuitBreakerState:
     """Tests for the CircuitBreakerState enum."""
@@ -49,124 +85,101 @@ class TestCircuitBreakerConfig:
 class TestCircuitBreaker:
     """Tests for the CircuitBreaker class."""
 
-    def test_initial_state_is_closed(self) -> None:
-        cb = CircuitBreaker("test")
+    def test_initial_state_is_closed(self, cb: CircuitBreaker) -> None:
         assert cb.state == CircuitBreakerState.CLOSED
 
-    def test_successful_call_stays_closed(self) -> None:
-        cb = CircuitBreaker("test")
+    def test_successful_call_stays_closed(self, cb: CircuitBreaker) -> None:
         result = cb.call(lambda: 42)
         assert result == 42
         assert cb.state == CircuitBreakerState.CLOSED
 
-    def test_failure_increments_count(self) -> None:
-        cb = CircuitBreaker("test", CircuitBreakerConfig(max_failures=5))
-
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
+    def test_failure_increments_count(self, cb_config: _ConfigFactory) -> None:
+        cb = CircuitBreaker("test", cb_config(max_failures=5))
 
         with pytest.raises(ValueError):
-            cb.call(failing)
+            cb.call(_raise_boom)
         assert cb.failure_count == 1
 
-    def test_max_failures_opens_circuit(self) -> None:
-        config = CircuitBreakerConfig(max_failures=3)
+    def test_max_failures_opens_circuit(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=3)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         for _ in range(3):
             with pytest.raises(ValueError):
-                cb.call(failing)
+                cb.call(_raise_boom)
 
         assert cb.state == CircuitBreakerState.OPEN
 
-    def test_open_circuit_rejects_calls(self) -> None:
-        config = CircuitBreakerConfig(max_failures=2)
+    def test_open_circuit_rejects_calls(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=2)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         for _ in range(2):
             with pytest.raises(ValueError):
-                cb.call(failing)
+                cb.call(_raise_boom)
 
         assert cb.is_open
         with pytest.raises(CircuitBreakerOpenError):
             cb.call(lambda: 42)
 
-    def test_cooldown_transitions_to_half_open(self) -> None:
-        config = CircuitBreakerConfig(max_failures=1, cooldown_seconds=0.05)
+    def test_cooldown_transitions_to_half_open(
+        self, cb_config: _ConfigFactory, fake_clock: list[float]
+    ) -> None:
+        config = cb_config(max_failures=1, cooldown_seconds=0.05)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb.call(failing)
+            cb.call(_raise_boom)
         assert cb.state == CircuitBreakerState.OPEN
 
-        time.sleep(0.06)
+        fake_clock[0] += 0.04
+        assert cb.state == CircuitBreakerState.OPEN
+        fake_clock[0] += 0.02
         assert cb.state == CircuitBreakerState.HALF_OPEN
 
-    def test_half_open_success_closes_circuit(self) -> None:
-        config = CircuitBreakerConfig(max_failures=1, cooldown_seconds=0.05)
+    def test_half_open_success_closes_circuit(
+        self, cb_config: _ConfigFactory, fake_clock: list[float]
+    ) -> None:
+        config = cb_config(max_failures=1, cooldown_seconds=0.05)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb.call(failing)
-        time.sleep(0.06)
+            cb.call(_raise_boom)
+        fake_clock[0] += 0.06
 
         assert cb.state == CircuitBreakerState.HALF_OPEN
         result = cb.call(lambda: "ok")
         assert result == "ok"
         assert cb.state == CircuitBreakerState.CLOSED
 
-    def test_half_open_failure_reopens_circuit(self) -> None:
-        config = CircuitBreakerConfig(max_failures=1, cooldown_seconds=0.05)
+    def test_half_open_failure_reopens_circuit(
+        self, cb_config: _ConfigFactory, fake_clock: list[float]
+    ) -> None:
+        config = cb_config(max_failures=1, cooldown_seconds=0.05)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb.call(failing)
-        time.sleep(0.06)
+            cb.call(_raise_boom)
+        fake_clock[0] += 0.06
 
         assert cb.state == CircuitBreakerState.HALF_OPEN
         with pytest.raises(ValueError):
-            cb.call(failing)
+            cb.call(_raise_boom)
         assert cb.state == CircuitBreakerState.OPEN
 
-    def test_reset_clears_state(self) -> None:
-        config = CircuitBreakerConfig(max_failures=1)
+    def test_reset_clears_state(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=1)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb.call(failing)
+            cb.call(_raise_boom)
         assert cb.state == CircuitBreakerState.OPEN
 
         cb.reset()
         assert cb.state == CircuitBreakerState.CLOSED
         assert cb.failure_count == 0
 
-    def test_call_with_args_and_kwargs(self) -> None:
-        cb = CircuitBreaker("test")
+    def test_call_with_args_and_kwargs(self, cb: CircuitBreaker) -> None:
 
         def add(a: int, b: int, extra: int = 0) -> int:
             return a + b + extra
@@ -174,59 +187,57 @@ class TestCircuitBreaker:
         result = cb.call(add, 1, 2, extra=3)
         assert result == 6
 
-    def test_failure_count_property(self) -> None:
-        cb = CircuitBreaker("test", CircuitBreakerConfig(max_failures=10))
-
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
+    def test_failure_count_property(self, cb_config: _ConfigFactory) -> None:
+        cb = CircuitBreaker("test", cb_config(max_failures=10))
 
         for _ in range(3):
             with pytest.raises(ValueError):
-                cb.call(failing)
+                cb.call(_raise_boom)
         assert cb.failure_count == 3
 
-    def test_is_open_property(self) -> None:
-        cb = CircuitBreaker("test")
+    def test_is_open_property(self, cb: CircuitBreaker, cb_config: _ConfigFactory) -> None:
         assert cb.is_open is False
 
-        config = CircuitBreakerConfig(max_failures=1)
+        config = cb_config(max_failures=1)
         cb2 = CircuitBreaker("test2", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb2.call(failing)
+            cb2.call(_raise_boom)
         assert cb2.is_open is True
 
-    def test_context_manager(self) -> None:
-        cb = CircuitBreaker("test")
+    def test_context_manager(self, cb: CircuitBreaker) -> None:
         with cb:
             cb.record_success()
         assert cb.state == CircuitBreakerState.CLOSED
 
-    def test_context_manager_with_failure(self) -> None:
-        config = CircuitBreakerConfig(max_failures=1)
+    def test_context_manager_with_failure(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=1)
         cb = CircuitBreaker("test", config)
         with cb:
             cb.record_failure(ValueError("boom"))
         assert cb.state == CircuitBreakerState.OPEN
 
-    def test_thread_safety(self) -> None:
-        config = CircuitBreakerConfig(max_failures=100)
+    def test_thread_safety(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=100)
         cb = CircuitBreaker("test", config)
         errors: list[Exception] = []
+        n_threads = 10
+        # Released together, the workers contend on the lock from the first
+        # call, so a short loop interleaves as much as a long staggered one.
+        start = threading.Barrier(n_threads)
+
+        def noop() -> int:
+            return 1
 
         def worker() -> None:
             try:
-                for _ in range(50):
-                    cb.call(lambda: 1)
+                start.wait()
+                for _ in range(20):
+                    cb.call(noop)
             except Exception as e:
                 errors.append(e)
 
-        threads = [threading.Thread(target=worker) for _ in range(10)]
+        threads = [threading.Thread(target=worker) for _ in range(n_threads)]
         for t in threads:
             t.start()
         for t in threads:
@@ -235,24 +246,20 @@ class TestCircuitBreaker:
         assert len(errors) == 0
         assert cb.state == CircuitBreakerState.CLOSED
 
-    def test_record_success_resets_failures(self) -> None:
-        config = CircuitBreakerConfig(max_failures=5)
+    def test_record_success_resets_failures(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=5)
         cb = CircuitBreaker("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         for _ in range(3):
             with pytest.raises(ValueError):
-                cb.call(failing)
+                cb.call(_raise_boom)
         assert cb.failure_count == 3
 
         cb.record_success()
         assert cb.failure_count == 0
 
-    def test_record_failure_with_error(self) -> None:
-        config = CircuitBreakerConfig(max_failures=5)
+    def test_record_failure_with_error(self, cb_config: _ConfigFactory) -> None:
+        config = cb_config(max_failures=5)
         cb = CircuitBreaker("test", config)
         err = RuntimeError("test error")
         cb.record_failure(err)
@@ -294,12 +301,8 @@ class TestCircuitBreakerRegistry:
         config = CircuitBreakerConfig(max_failures=1)
         cb = registry.get_or_create("test", config)
 
-        def failing() -> None:
-            msg = "boom"
-            raise ValueError(msg)
-
         with pytest.raises(ValueError):
-            cb.call(failing)
+            cb.call(_raise_boom)
         assert cb.state == CircuitBreakerState.OPEN
 
         registry.reset_all()
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from claude_code_kazuba import event_bus
 from claude_code_kazuba.event_bus import Event, EventBus
 
 
@@ -26,6 +27,10 @@ class TestEvent:
         with pytest.raises(AttributeError):
             ev.event_type = "other"  # type: ignore[misc]
 
+    def test_event_has_no_instance_dict(self) -> None:
+        ev = Event(event_type="test", data={}, timestamp=0.0, source="")
+        assert not hasattr(ev, "__dict__")
+
     def test_event_source(self) -> None:
         ev = Event(event_type="test", data={}, timestamp=0.0, source="my-hook")
         assert ev.source == "my-hook"
@@ -76,11 +81,36 @@ class TestEventBus:
         bus.publish("evt", {})
         assert order == [1, 2, 3]
 
+    def test_equal_priority_keeps_subscription_order(self) -> None:
+        bus = EventBus()
+        order: list[str] = []
+        bus.subscribe("evt", lambda e: order.append("a"), priority=1)
+        bus.subscribe("evt", lambda e: order.append("late"), priority=5)
+        bus.subscribe("evt", lambda e: order.append("b"), priority=1)
+        bus.subscribe("evt", lambda e: order.append("first"), priority=0)
+        bus.subscribe("evt", lambda e: order.append("c"), priority=1)
+        bus.publish("evt", {})
+        assert order == ["first", "a", "b", "c", "late"]
+
     def test_publish_no_subscribers(self) -> None:
         bus = EventBus()
         # Should not raise
         bus.publish("unknown.event", {"data": 42})
 
+    def test_publish_without_subscribers_builds_no_event(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bus = EventBus()
+        bus.subscribe("other", lambda e: None)
+
+        def _no_event(**kwargs: object) -> Event:
+            raise AssertionError("Event built for an event type with no subscribers")
+
+        monkeypatch.setattr(event_bus, "Event", _no_event)
+        bus.publish("unknown.event", {"data": 42})
+        bus.publish_async("unknown.event", {"data": 42})
+        assert bus._executor is None  # no pool started for nothing to run
+
     def test_event_data_passed(self) -> None:
         bus = EventBus()
         received: list[Event] = []
@@ -95,6 +125,22 @@ class TestEventBus:
         bus.subscribe("type_b", lambda e: None)
         assert bus.event_types == {"type_a", "type_b"}
 
+    def test_event_types_tracks_unsubscribe(self) -> None:
+        bus = EventBus()
+
+        def handler(e: Event) -> None:
+            pass
+
+        bus.subscribe("a", handler)
+        bus.subscribe("a", handler, priority=1)
+        bus.subscribe("b", handler)
+        before = bus.event_types
+        bus.unsubscribe("a", handler)
+        assert bus.event_types == {"b"}
+        assert before == {"a", "b"}  # earlier snapshots are not mutated
+        bus.unsubscribe("b", handler)
+        assert bus.event_types == set()
+
     def test_subscribers_list(self) -> None:
         bus = EventBus()
         handler = MagicMock()
@@ -148,6 +194,40 @@ class TestEventBus:
 
         assert len(counter) == 20
 
+    def test_subscription_change_during_publish(self) -> None:
+        bus = EventBus()
+        calls: list[str] = []
+
+        def late(e: Event) -> None:
+            calls.append("late")
+
+        def second(e: Event) -> None:
+            calls.append("second")
+
+        def first(e: Event) -> None:
+            calls.append("first")
+            bus.unsubscribe("evt", second)
+            bus.subscribe("evt", late, priority=9)
+
+        bus.subscribe("evt", first, priority=0)
+        bus.subscribe("evt", second, priority=1)
+        bus.publish("evt", {})
+        # The in-flight publish sees the subscribers as they were when it began
+        assert calls == ["first", "second"]
+        calls.clear()
+        bus.unsubscribe("evt", first)
+        bus.publish("evt", {})
+        assert calls == ["late"]
+
+    def test_retained_events_are_not_reused(self) -> None:
+        bus = EventBus()
+        received: list[Event] = []
+        bus.subscribe("evt", received.append)
+        bus.publish("evt", {"n": 1}, source="a")
+        bus.publish("evt", {"n": 2}, source="b")
+        assert received[0] is not received[1]
+        assert [(e.data["n"], e.source) for e in received] == [(1, "a"), (2, "b")]
+
     def test_publish_returns_none(self) -> None:
         bus = EventBus()
         result = bus.publish("evt", {})
@@ -173,11 +253,76 @@ class TestEventBus:
 
         bus.subscribe("evt", handler)
         bus.publish_async("evt", {"async": True})
-        # Give thread pool time to execute
-        time.sleep(0.1)
+        # Drain the pool instead of sleeping for it
+        bus.shutdown()
         assert len(received) == 1
         assert received[0].data == {"async": True}
 
+    def test_publish_async_reuses_pool_threads(self) -> None:
+        bus = EventBus()
+        threads: set[str] = set()
+        lock = threading.Lock()
+
+        def handler(e: Event) -> None:
+            with lock:
+                threads.add(threading.current_thread().name)
+
+        bus.subscribe("evt", handler)
+        for _ in range(20):
+            bus.publish_async("evt", {})
+        bus.shutdown()
+        assert 1 <= len(threads) <= 2
+        assert all(name.startswith("eventbus") for name in threads)
+
+    def test_publish_async_after_shutdown(self) -> None:
+        bus = EventBus()
+        received: list[Event] = []
+        bus.subscribe("evt", received.append)
+        bus.shutdown()  # no pool yet: no-op
+        bus.publish_async("evt", {"n": 1})
+        bus.shutdown()
+        bus.publish_async("evt", {"n": 2})
+        bus.shutdown()
+        assert [e.data["n"] for e in received] == [1, 2]
+
+    def test_publish_async_races_shutdown(self) -> None:
+        bus = EventBus()
+        received: list[Event] = []
+        lock = threading.Lock()
+
+        def handler(e: Event) -> None:
+            with lock:
+                received.append(e)
+
+        bus.subscribe("evt", handler)
+        errors: list[BaseException] = []
+        stop = threading.Event()
+
+        def shutter() -> None:
+            while not stop.is_set():
+                bus.shutdown(wait=False)
+
+        def publisher() -> None:
+            try:
+                for i in range(500):
+                    bus.publish_async("evt", {"n": i})
+            except BaseException as exc:  # pragma: no cover - the failure case
+                errors.append(exc)
+
+        closer = threading.Thread(target=shutter)
+        pubs = [threading.Thread(target=publisher) for _ in range(2)]
+        closer.start()
+        for t in pubs:
+            t.start()
+        for t in pubs:
+            t.join()
+        stop.set()
+        closer.join()
+        bus.shutdown()
+
+        assert errors == []
+        assert len(received) == 1000
+
     def test_unsubscribe_nonexistent(self) -> None:
         bus = EventBus()
         # Should not raise
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from claude_code_kazuba import hook_logger
 from claude_code_kazuba.hook_logger import HookLogger, LogEntry, LogLevel
 
 
@@ -95,6 +97,26 @@ class TestHookLogger:
         parsed = json.loads(content.strip())
         assert parsed["message"] == "flush test"
 
+    def test_flush_append(self, tmp_path: Path) -> None:
+        out = tmp_path / "test.jsonl"
+        logger = HookLogger("test")
+        logger.info("first")
+        logger.flush(out)
+        logger.clear()
+        logger.info("second")
+        logger.warning("third")
+        logger.flush(out, append=True)
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["first", "second", "third"]
+
+    def test_flush_replaces_existing_file(self, tmp_path: Path) -> None:
+        out = tmp_path / "test.jsonl"
+        out.write_text("stale content that is longer than the new payload\n" * 10)
+        logger = HookLogger("test")
+        logger.info("fresh")
+        logger.flush(out)
+        assert json.loads(out.read_text(encoding="utf-8"))["message"] == "fresh"
+
     def test_clear_entries(self) -> None:
         logger = HookLogger("test")
         logger.info("a")
@@ -108,6 +130,7 @@ class TestHookLogger:
         for i in range(10):
             logger.info(f"msg {i}")
         assert len(logger.entries) == 5
+        assert [e.message for e in logger.entries] == [f"msg {i}" for i in range(5, 10)]
 
     def test_metadata_in_entry(self) -> None:
         logger = HookLogger("test")
@@ -123,6 +146,25 @@ class TestHookLogger:
         assert entry.timestamp != ""
         assert "T" in entry.timestamp  # ISO format
 
+    def test_timestamp_matches_clock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ticks = iter(
+            [
+                1_767_225_599_999_999_000,  # 2025-12-31T23:59:59.999999
+                1_767_225_600_000_001_000,  # next second: prefix re-formatted
+                1_767_225_600_250_000_000,  # same second: cached prefix
+            ]
+        )
+        monkeypatch.setattr(hook_logger, "_now_ns", lambda: next(ticks))
+        logger = HookLogger("test")
+        for _ in range(3):
+            logger.info("tick")
+        stamps = [datetime.fromisoformat(e.timestamp) for e in logger.entries]
+        assert stamps == [
+            datetime(2025, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+            datetime(2026, 1, 1, 0, 0, 0, 1, tzinfo=UTC),
+            datetime(2026, 1, 1, 0, 0, 0, 250000, tzinfo=UTC),
+        ]
+
     def test_hook_name_in_entry(self) -> None:
         logger = HookLogger("my-hook")
         logger.info("test")
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
+import sys
 import threading
 import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
 
 import pytest
 
@@ -86,6 +92,16 @@ class TestTraceManager:
         duration = result["spans"][0]["duration_ms"]
         assert duration >= 15.0  # At least 15ms
 
+    def test_child_duration_ends_at_child_exit(self) -> None:
+        tm = TraceManager("test")
+        with tm.start_span("parent"):
+            with tm.start_span("child"):
+                pass
+            time.sleep(0.02)
+        parent = tm.to_dict()["spans"][0]
+        assert parent["duration_ms"] >= 15.0
+        assert parent["children"][0]["duration_ms"] < parent["duration_ms"] - 10.0
+
     def test_record_event(self) -> None:
         tm = TraceManager("test")
         with tm.start_span("op"):
@@ -113,6 +129,43 @@ class TestTraceManager:
         parsed = json.loads(json_str)
         assert parsed["session_name"] == "test"
 
+    def test_to_json_metadata_values(self) -> None:
+        @dataclass
+        class Point:
+            a: int
+
+        tm = TraceManager("test")
+        with tm.start_span("outer"), tm.start_span("inner"):
+            tm.record(
+                "ev",
+                {
+                    "path": Path("/tmp/x"),
+                    "when": datetime(2026, 1, 1),
+                    "point": Point(1),
+                    "ratio": math.nan,
+                    "big": 2**70,
+                },
+            )
+        parsed = json.loads(tm.to_json())
+        meta = parsed["spans"][0]["children"][0]["events"][0]["metadata"]
+        assert meta["path"] == "/tmp/x"
+        assert meta["when"] == "2026-01-01 00:00:00"
+        assert meta["point"].endswith("Point(a=1)")
+        assert math.isnan(meta["ratio"])
+        assert meta["big"] == 2**70
+
+    def test_to_dict_deeper_than_recursion_limit(self) -> None:
+        depth = sys.getrecursionlimit() + 100
+        tm = TraceManager("test")
+        with ExitStack() as stack:
+            for i in range(depth):
+                stack.enter_context(tm.start_span(f"s{i}"))
+        node = tm.to_dict()["spans"][0]
+        for i in range(1, depth):
+            (node,) = node["children"]
+            assert node["name"] == f"s{i}"
+        assert node["children"] == []
+
     def test_reset_clears_spans(self) -> None:
         tm = TraceManager("test")
         with tm.start_span("op"):
@@ -180,3 +233,20 @@ class TestTraceManager:
         span_names = {s["name"] for s in trace["spans"]}
         assert "t1" in span_names
         assert "t2" in span_names
+
+    def test_finished_threads_leave_no_stack(self) -> None:
+        tm = TraceManager("test")
+
+        def worker(name: str) -> None:
+            tm.record("outside", {})
+            with tm.start_span(name), tm.start_span(f"{name}-child"):
+                pass
+
+        threads = [threading.Thread(target=worker, args=(f"t{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(tm.to_dict()["spans"]) == 4
+        assert tm._stacks == {}
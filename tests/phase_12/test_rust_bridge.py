@@ -6,6 +6,9 @@ extension is compiled. They use whatever backend is available (rust or python).
 
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
 
 from claude_code_kazuba.patterns import BashSafetyPatterns, SecretPatterns
@@ -202,6 +205,34 @@ def test_rust_bridge_singleton_reset() -> None:
     assert b1 is not b2
 
 
+def test_rust_bridge_singleton_concurrent_creation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Threads racing on the first instance() call all get one instance."""
+    built: list[RustBridge] = []
+    original_init = RustBridge.__init__
+
+    def slow_init(self: RustBridge, config: RustBridgeConfig | None = None) -> None:
+        time.sleep(0.01)  # Widen the window in which a racing thread could build another
+        original_init(self, config)
+        built.append(self)
+
+    monkeypatch.setattr(RustBridge, "__init__", slow_init)
+    barrier = threading.Barrier(8)
+    got: list[RustBridge] = []
+
+    def worker() -> None:
+        barrier.wait()
+        got.append(RustBridge.instance())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1
+    assert all(b is built[0] for b in got)
+
+
 # ---------------------------------------------------------------------------
 # 14. Config
 # ---------------------------------------------------------------------------
@@ -297,6 +328,21 @@ def test_rust_bridge_benchmark() -> None:
     assert len(results) >= 3
     assert all(isinstance(r, BenchmarkResult) for r in results)
     assert all(r.elapsed_ns >= 0 for r in results)
+    assert all(type(r.elapsed_ns) is int for r in results)
+
+
+def test_rust_bridge_no_clock_outside_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without benchmark mode the clock is never read and nothing is recorded."""
+
+    def _no_clock() -> int:
+        raise AssertionError("clock read outside benchmark mode")
+
+    b = RustBridge(config=RustBridgeConfig(benchmark_mode=False))
+    monkeypatch.setattr(time, "perf_counter_ns", _no_clock)
+    b.check_secrets("no secrets")
+    b.validate_bash("ls -la")
+    b.match_patterns("some text")
+    assert b.get_benchmarks() == []
 
 
 # ---------------------------------------------------------------------------